@@ -7,11 +7,73 @@ from pathlib import Path
 
 import streamlit as st
 
-sys.path.insert(0, str(Path(__file__).parent))
+_APP_DIR = str(Path(__file__).parent)
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
 from utils.theme import inject_theme
 from utils.connection import get_db_stats
 
+# ── Static HTML (built once at import, not per rerun) ────────────────
+_HEADER_HTML = """
+<div class="page-header">
+  <div class="page-title">NYC Affordable Housing Graph</div>
+  <div class="page-sub">
+    Exploring naturally occurring affordable housing across New York City's five boroughs
+  </div>
+</div>
+"""
+
+_ABOUT_HTML = """
+<div class="about-section">
+<h4 style="margin-top:0">What is this?</h4>
+<p>
+This tool converts NYC's NOAH (Naturally Occurring Affordable Housing) database
+from PostgreSQL into a <strong>Neo4j knowledge graph</strong>, enabling
+relationship-centric queries that are cumbersome in traditional SQL.
+</p>
+<p>
+Each housing project is linked to its ZIP code, census tract, and
+affordability metrics. ZIP codes are connected to their geographic
+neighbors via shared boundaries.
+</p>
+<p style="margin-bottom:0">
+Ask questions in plain English on the <strong>Ask</strong> page,
+explore pre-built charts on <strong>Insights</strong>, or write
+Cypher queries directly on <strong>Explore</strong>.
+</p>
+</div>
+"""
+
+_STAT_CARD_TMPL = """
+<div class="stat-card">
+  <div class="stat-val">{value}</div>
+  <div class="stat-lbl">{label}</div>
+  <div class="stat-hint">{hint}</div>
+</div>
+"""
+
+_STAT_GRID_TMPL = (
+    '<div style="display:grid;grid-template-columns:repeat(5,1fr);gap:1rem">{cards}</div>'
+)
+
+_SCHEMA_HTML = """
+<div style="font-size:0.85rem;line-height:2.2">
+<b style="color:#555;font-size:0.7rem;text-transform:uppercase;letter-spacing:.05em">Nodes</b><br>
+<span class="schema-node">HousingProject</span>
+<span class="schema-node">ZipCode</span>
+<span class="schema-node">AffordabilityAnalysis</span>
+<span class="schema-node">RentBurden</span>
+<br><br>
+<b style="color:#555;font-size:0.7rem;text-transform:uppercase;letter-spacing:.05em">Relationships</b><br>
+<span class="schema-rel">LOCATED_IN_ZIP</span>
+<span class="schema-rel">NEIGHBORS</span>
+<span class="schema-rel">IN_CENSUS_TRACT</span>
+<span class="schema-rel">CONTAINS_TRACT</span>
+<span class="schema-rel">HAS_AFFORDABILITY_DATA</span>
+</div>
+"""
+
 st.set_page_config(
     page_title="NYC Housing Graph",
     page_icon="🏙",
@@ -31,33 +93,18 @@ with st.sidebar:
         "A knowledge graph of NYC affordable housing data. "
         "Query in natural language or write Cypher directly."
     )
+    # No st.rerun() needed: this sidebar block executes before the stats
+    # section below, so clearing here makes the same pass refetch.
+    if st.button("↻ Refresh stats", use_container_width=True):
+        get_db_stats.clear()
 
 # ── Header ───────────────────────────────────────────────────────────
-st.markdown(
-    """
-    <div class="page-header">
-      <div class="page-title">NYC Affordable Housing Graph</div>
-      <div class="page-sub">
-        Exploring naturally occurring affordable housing across New York City's five boroughs
-      </div>
-    </div>
-    """,
-    unsafe_allow_html=True,
-)
+st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 # ── Live Stats ───────────────────────────────────────────────────────
 stats = get_db_stats()
 
-total_rels = sum(
-    stats.get(f"r_{r}", 0)
-    for r in [
-        "LOCATED_IN_ZIP",
-        "NEIGHBORS",
-        "IN_CENSUS_TRACT",
-        "CONTAINS_TRACT",
-        "HAS_AFFORDABILITY_DATA",
-    ]
-)
+total_rels = stats.get("total_rels", 0)
 
 stat_items = [
     ("Housing Projects", stats.get("n_HousingProject", "—"), "buildings across 5 boroughs"),
@@ -67,20 +114,16 @@ stat_items = [
     ("Connections",     total_rels or "—",                    "graph relationships"),
 ]
 
-cols = st.columns(5)
-for col, (label, value, hint) in zip(cols, stat_items):
-    with col:
-        display = f"{value:,}" if isinstance(value, int) else str(value)
-        st.markdown(
-            f"""
-            <div class="stat-card">
-              <div class="stat-val">{display}</div>
-              <div class="stat-lbl">{label}</div>
-              <div class="stat-hint">{hint}</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+# One markdown delta for the whole grid instead of st.columns(5) + 5 calls
+cards = "".join(
+    _STAT_CARD_TMPL.format(
+        value=f"{value:,}" if isinstance(value, int) else str(value),
+        label=label,
+        hint=hint,
+    )
+    for label, value, hint in stat_items
+)
+st.markdown(_STAT_GRID_TMPL.format(cards=cards), unsafe_allow_html=True)
 
 st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
@@ -104,17 +147,22 @@ for col, ex in zip(chip_cols, EXAMPLES):
 
 st.markdown("")
 
-qcol, bcol = st.columns([5, 1])
-with qcol:
-    quick_q = st.text_input(
-        "question",
-        placeholder="e.g. Which neighborhoods have the most affordable housing units?",
-        label_visibility="collapsed",
-    )
-with bcol:
-    if st.button("Search →", type="primary", use_container_width=True) and quick_q.strip():
-        st.session_state["pending_query"] = quick_q.strip()
-        st.switch_page("pages/1_Ask.py")
+# Form: reruns fire on submit only, not on every keystroke
+with st.form("quick_search", border=False):
+    qcol, bcol = st.columns([5, 1])
+    with qcol:
+        quick_q = st.text_input(
+            "question",
+            placeholder="e.g. Which neighborhoods have the most affordable housing units?",
+            label_visibility="collapsed",
+        )
+    with bcol:
+        submitted = st.form_submit_button(
+            "Search →", type="primary", use_container_width=True
+        )
+if submitted and quick_q.strip():
+    st.session_state["pending_query"] = quick_q.strip()
+    st.switch_page("pages/1_Ask.py")
 
 st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
@@ -122,51 +170,11 @@ st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 left, right = st.columns([3, 2])
 
 with left:
-    st.markdown(
-        """
-        <div class="about-section">
-        <h4 style="margin-top:0">What is this?</h4>
-        <p>
-        This tool converts NYC's NOAH (Naturally Occurring Affordable Housing) database
-        from PostgreSQL into a <strong>Neo4j knowledge graph</strong>, enabling
-        relationship-centric queries that are cumbersome in traditional SQL.
-        </p>
-        <p>
-        Each housing project is linked to its ZIP code, census tract, and
-        affordability metrics. ZIP codes are connected to their geographic
-        neighbors via shared boundaries.
-        </p>
-        <p style="margin-bottom:0">
-        Ask questions in plain English on the <strong>Ask</strong> page,
-        explore pre-built charts on <strong>Insights</strong>, or write
-        Cypher queries directly on <strong>Explore</strong>.
-        </p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_ABOUT_HTML, unsafe_allow_html=True)
 
 with right:
     st.markdown("**Graph schema**")
-    st.markdown(
-        """
-        <div style="font-size:0.85rem;line-height:2.2">
-        <b style="color:#555;font-size:0.7rem;text-transform:uppercase;letter-spacing:.05em">Nodes</b><br>
-        <span class="schema-node">HousingProject</span>
-        <span class="schema-node">ZipCode</span>
-        <span class="schema-node">AffordabilityAnalysis</span>
-        <span class="schema-node">RentBurden</span>
-        <br><br>
-        <b style="color:#555;font-size:0.7rem;text-transform:uppercase;letter-spacing:.05em">Relationships</b><br>
-        <span class="schema-rel">LOCATED_IN_ZIP</span>
-        <span class="schema-rel">NEIGHBORS</span>
-        <span class="schema-rel">IN_CENSUS_TRACT</span>
-        <span class="schema-rel">CONTAINS_TRACT</span>
-        <span class="schema-rel">HAS_AFFORDABILITY_DATA</span>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_SCHEMA_HTML, unsafe_allow_html=True)
     st.markdown("")
     st.markdown("**Data source**")
     st.caption(
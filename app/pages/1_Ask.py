@@ -5,16 +5,19 @@ NYC Housing Graph — Ask (Natural Language Query)
 import sys
 import os
 import time
+from collections import deque
+from itertools import islice
 from pathlib import Path
 
 import streamlit as st
-import pandas as pd
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+for _p in (str(Path(__file__).parent.parent),
+           str(Path(__file__).parent.parent.parent / "src")):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
 
 from utils.theme import inject_theme
-from utils.connection import get_config, run_query
+from utils.connection import get_config, get_translator, run_query
 from utils.explain import cypher_to_dot
 from utils.geojson_export import rows_to_geojson
 
@@ -38,18 +41,26 @@ with st.sidebar:
 
     st.markdown("---")
 
-    # History in sidebar
-    if st.session_state.get("query_history"):
+    # History in sidebar — fragment so toggling/submitting elsewhere
+    # doesn't re-render it as part of a full-page pass
+    @st.fragment
+    def _render_history() -> None:
+        if not st.session_state.get("query_history"):
+            return
         st.markdown("**Recent**")
-        for item in st.session_state["query_history"][:6]:
+        # Join into a single markdown call: 1 frontend delta instead of 6
+        html_parts = []
+        for item in islice(st.session_state["query_history"], 6):
             icon = "✓" if item["ok"] else "✗"
             color = "#5CB85C" if item["ok"] else "#E05C5C"
-            st.markdown(
+            html_parts.append(
                 f'<div style="font-size:0.78rem;color:#AAA;margin:0.3rem 0;line-height:1.4">'
                 f'<span style="color:{color}">{icon}</span> '
-                f'{item["question"][:42]}{"…" if len(item["question"])>42 else ""}</div>',
-                unsafe_allow_html=True,
+                f'{item["question"][:42]}{"…" if len(item["question"])>42 else ""}</div>'
             )
+        st.markdown("".join(html_parts), unsafe_allow_html=True)
+
+    _render_history()
 
 # ── Header ────────────────────────────────────────────────────────────
 st.markdown(
@@ -64,9 +75,14 @@ st.markdown(
 
 # ── Session state ─────────────────────────────────────────────────────
 if "query_history" not in st.session_state:
-    st.session_state["query_history"] = []
+    # deque: O(1) appendleft and a hard cap on session memory
+    st.session_state["query_history"] = deque(maxlen=200)
 if "result" not in st.session_state:
     st.session_state["result"] = None
+if "answer_cache" not in st.session_state:
+    # Normalized question → full result dict; re-asking skips the LLM
+    # call and Cypher execution entirely
+    st.session_state["answer_cache"] = {}
 
 # ── API key ───────────────────────────────────────────────────────────
 api_key = (
@@ -85,19 +101,20 @@ if not api_key:
     st.stop()
 
 # ── Example chips ─────────────────────────────────────────────────────
-EXAMPLES = [
-    ("By borough",    "How many housing projects are in each borough?"),
-    ("Rent burden",   "Which ZIP codes in Brooklyn have the highest rent burden?"),
-    ("Neighbors",     "Find housing projects in ZIP codes neighboring 10001"),
-    ("High burden",   "Show census tracts with severe rent burden above 40%"),
-    ("Affordability", "Which ZIP codes have the lowest rent burden rate?"),
-    ("Income gap",    "Compare median income across Manhattan ZIP codes"),
-]
+# Widget keys precomputed once — no per-rerun f-string formatting
+EXAMPLES = (
+    ("By borough",    "How many housing projects are in each borough?",          "chip_By borough"),
+    ("Rent burden",   "Which ZIP codes in Brooklyn have the highest rent burden?", "chip_Rent burden"),
+    ("Neighbors",     "Find housing projects in ZIP codes neighboring 10001",     "chip_Neighbors"),
+    ("High burden",   "Show census tracts with severe rent burden above 40%",     "chip_High burden"),
+    ("Affordability", "Which ZIP codes have the lowest rent burden rate?",        "chip_Affordability"),
+    ("Income gap",    "Compare median income across Manhattan ZIP codes",         "chip_Income gap"),
+)
 
 ex_cols = st.columns(len(EXAMPLES))
-for col, (label, q_text) in zip(ex_cols, EXAMPLES):
+for col, (label, q_text, key) in zip(ex_cols, EXAMPLES):
     with col:
-        if st.button(label, use_container_width=True, key=f"chip_{label}"):
+        if st.button(label, use_container_width=True, key=key):
             st.session_state["ask_question"] = q_text
 
 # Handle cross-page navigation (from Home quick search)
@@ -120,32 +137,37 @@ with btn_col:
 # ── Execute ───────────────────────────────────────────────────────────
 if submitted and question.strip():
     try:
-        from noah_converter.text2cypher import Text2CypherTranslator
-        from noah_converter.utils.db_connection import Neo4jConnection
-
         config = get_config()
-        neo4j_conn = Neo4jConnection(config.target_db)
-
-        with st.spinner(""):
-            translator = Text2CypherTranslator(
-                neo4j_conn=neo4j_conn,
-                llm_provider="claude",
-                api_key=api_key,
-                model=config.text2cypher.model,
-            )
-            t0 = time.time()
-            result = translator.query(
-                question=question,
-                execute=True,
-                explain=show_explain,
-            )
-            result["elapsed"] = round(time.time() - t0, 2)
 
-        neo4j_conn.close()
+        # Response cache: case/whitespace-insensitive repeats are served
+        # from session state without another LLM + Neo4j round-trip.
+        # The explain flag is part of the key — an answer cached with
+        # Explain off has no explanation to show once it's toggled on.
+        cache_key = (
+            f"{config.text2cypher.model}|{int(show_explain)}|"
+            f"{' '.join(question.lower().split())}"
+        )
+        cached = st.session_state["answer_cache"].get(cache_key)
+
+        if cached is not None:
+            result = cached
+        else:
+            with st.spinner(""):
+                translator = get_translator(api_key, config.text2cypher.model)
+                t0 = time.time()
+                result = translator.query(
+                    question=question,
+                    execute=True,
+                    explain=show_explain,
+                )
+                result["elapsed"] = round(time.time() - t0, 2)
+            if not result.get("error"):
+                st.session_state["answer_cache"][cache_key] = result
+
         st.session_state["result"] = result
         st.session_state["result_question"] = question
 
-        st.session_state["query_history"].insert(0, {
+        st.session_state["query_history"].appendleft({
             "question": question,
             "cypher": result.get("cypher", ""),
             "rows": len(result.get("results") or []),
@@ -157,8 +179,13 @@ if submitted and question.strip():
         st.session_state["result_question"] = question
 
 # ── Display results ───────────────────────────────────────────────────
-result = st.session_state.get("result")
-if result:
+# Fragment: interactions inside the result panel rerun only this block,
+# not the whole page (theme injection, chips, history, …).
+@st.fragment
+def _render_result() -> None:
+    result = st.session_state.get("result")
+    if not result:
+        return
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
     if result.get("error"):
@@ -166,54 +193,84 @@ if result:
             f'<div class="error-msg">⚠ {result["error"]}</div>',
             unsafe_allow_html=True,
         )
-    else:
-        rows = result.get("results") or []
-        elapsed = result.get("elapsed", 0)
+        return
+
+    rows = result.get("results") or []
+    elapsed = result.get("elapsed", 0)
+
+    # ── Cypher ────────────────────────────────────────────────────
+    if show_cypher and result.get("cypher"):
+        with st.expander("Cypher query", expanded=False):
+            st.code(result["cypher"], language="cypher")
 
-        # ── Cypher ────────────────────────────────────────────────────
-        if show_cypher and result.get("cypher"):
-            with st.expander("Cypher query", expanded=False):
-                st.code(result["cypher"], language="cypher")
+    # ── Table ─────────────────────────────────────────────────────
+    if rows:
+        # Build the DataFrame and CSV once per result; reruns that merely
+        # toggle sidebar switches reuse the stored objects.
+        df = result.get("_df")
+        if df is None:
+            import pandas as pd  # deferred: only needed once a query returns rows
 
-        # ── Table ─────────────────────────────────────────────────────
-        if rows:
             df = pd.DataFrame(rows)
+            result["_df"] = df
 
-            meta_col, dl_col, geo_col = st.columns([4, 1, 1])
-            with meta_col:
-                st.markdown(
-                    f'<div class="result-meta">'
-                    f'{len(rows)} result{"s" if len(rows)!=1 else ""}'
-                    f' &nbsp;·&nbsp; {elapsed}s'
-                    f'</div>',
-                    unsafe_allow_html=True,
-                )
-            with dl_col:
-                st.download_button(
-                    "↓ CSV",
-                    df.to_csv(index=False),
-                    file_name="results.csv",
-                    mime="text/csv",
-                    use_container_width=True,
-                )
-            with geo_col:
-                geojson = rows_to_geojson(rows)
-                st.download_button(
-                    "↓ GeoJSON",
-                    geojson or "{}",
-                    file_name="results.geojson",
-                    mime="application/geo+json",
-                    use_container_width=True,
-                    disabled=geojson is None,
-                    help="Available when results contain center_lat / center_lon columns",
-                )
+        csv_bytes = result.get("_csv")
+        if csv_bytes is None:
+            csv_bytes = df.to_csv(index=False).encode()
+            result["_csv"] = csv_bytes
 
+        meta_col, dl_col, geo_col = st.columns([4, 1, 1])
+        with meta_col:
+            st.markdown(
+                f'<div class="result-meta">'
+                f'{len(rows)} result{"s" if len(rows)!=1 else ""}'
+                f' &nbsp;·&nbsp; {elapsed}s'
+                f'</div>',
+                unsafe_allow_html=True,
+            )
+        with dl_col:
+            st.download_button(
+                "↓ CSV",
+                csv_bytes,
+                file_name="results.csv",
+                mime="text/csv",
+                use_container_width=True,
+            )
+        with geo_col:
+            geojson = rows_to_geojson(rows)
+            st.download_button(
+                "↓ GeoJSON",
+                geojson or "{}",
+                file_name="results.geojson",
+                mime="application/geo+json",
+                use_container_width=True,
+                disabled=geojson is None,
+                help="Available when results contain center_lat / center_lon columns",
+            )
+
+        # Cap the default view — serializing thousands of rows to the
+        # frontend dominates render time; CSV download stays unlimited.
+        MAX_PREVIEW = 200
+        if len(df) > MAX_PREVIEW and not st.checkbox(
+            f"Show all {len(df):,} rows", key="ask_show_all_rows"
+        ):
+            st.dataframe(df.head(MAX_PREVIEW), use_container_width=True, hide_index=True)
+            st.caption(f"Showing first {MAX_PREVIEW} rows.")
+        else:
             st.dataframe(df, use_container_width=True, hide_index=True)
 
-            # Auto bar chart: first text col + first numeric col, ≤ 30 rows
-            num_cols = df.select_dtypes("number").columns.tolist()
-            txt_cols = df.select_dtypes("object").columns.tolist()
-            if num_cols and txt_cols and 2 <= len(df) <= 30:
+        # Auto bar chart: first text col + first numeric col, ≤ 30 rows.
+        # Built once per result and kept in session_state — reruns reuse
+        # the figure instead of rebuilding the Plotly JSON.
+        if "_fig" not in result:
+            result["_fig"] = None
+            # Cheap gates first: row count and width before the dtype scan
+            if 2 <= len(df) <= 30 and len(df.columns) >= 2:
+                num_cols = df.select_dtypes("number").columns.tolist()
+                txt_cols = df.select_dtypes("object").columns.tolist()
+            else:
+                num_cols = txt_cols = []
+            if num_cols and txt_cols:
                 try:
                     import plotly.express as px
 
@@ -235,21 +292,26 @@ if result:
                         plot_bgcolor="#F9F7F4",
                         paper_bgcolor="#F9F7F4",
                     )
-                    st.plotly_chart(fig, use_container_width=True)
+                    result["_fig"] = fig
                 except Exception:
                     pass
-        else:
-            st.info("No results found for this query.")
-
-        # ── Explain panel ──────────────────────────────────────────────
-        if show_explain and result.get("cypher"):
-            dot = cypher_to_dot(result["cypher"])
-            if dot or result.get("explanation"):
-                with st.expander("Explain — traversal path & summary", expanded=True):
-                    if dot:
-                        st.graphviz_chart(dot, use_container_width=False)
-                    if result.get("explanation"):
-                        st.markdown(
-                            f'<div class="answer-box">{result["explanation"]}</div>',
-                            unsafe_allow_html=True,
-                        )
+        if result["_fig"] is not None:
+            st.plotly_chart(result["_fig"], use_container_width=True)
+    else:
+        st.info("No results found for this query.")
+
+    # ── Explain panel ──────────────────────────────────────────────
+    if show_explain and result.get("cypher"):
+        dot = cypher_to_dot(result["cypher"])
+        if dot or result.get("explanation"):
+            with st.expander("Explain — traversal path & summary", expanded=True):
+                if dot:
+                    st.graphviz_chart(dot, use_container_width=False)
+                if result.get("explanation"):
+                    st.markdown(
+                        f'<div class="answer-box">{result["explanation"]}</div>',
+                        unsafe_allow_html=True,
+                    )
+
+
+_render_result()
@@ -2,119 +2,172 @@
 NYC Housing Graph — Explore (Cypher Editor + Schema Reference + Saved Queries)
 """
 
+import json
+import re
 import sys
 import time
 from pathlib import Path
+from types import MappingProxyType
 
-import tempfile
 import streamlit as st
-import pandas as pd
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_APP_DIR = str(Path(__file__).parent.parent)
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
 from utils.theme import inject_theme
-from utils.connection import run_query
+from utils.connection import _get_driver
 from utils.saved_queries import list_saved, save_query, delete_query
 from utils.geojson_export import rows_to_geojson
 
-st.set_page_config(
-    page_title="Explore — NYC Housing Graph",
-    page_icon="🔎",
-    layout="wide",
-)
-inject_theme()
-
-with st.sidebar:
-    st.markdown(
-        '<span class="sidebar-brand">NYC Housing <span>Graph</span></span>',
-        unsafe_allow_html=True,
-    )
-    st.markdown("---")
-    st.caption("Write Cypher queries directly against the graph database.")
 
-st.markdown(
-    """
-    <div class="page-header">
-      <div class="page-title">Explore</div>
-      <div class="page-sub">Cypher query editor · schema reference · saved queries</div>
-    </div>
-    """,
-    unsafe_allow_html=True,
-)
+# Saved queries live in a JSON file; cache the read so reruns of the
+# Saved tab don't hit disk. Mutations clear the cache explicitly below.
+@st.cache_data(ttl=5, show_spinner=False)
+def _list_saved_cached() -> list[dict]:
+    return list_saved()
 
-tab_editor, tab_graph, tab_saved, tab_schema = st.tabs(
-    ["Query Editor", "Graph View", "Saved Queries", "Schema Reference"]
-)
 
-# ── Tab 1: Query Editor ───────────────────────────────────────────────
-with tab_editor:
-
-    EXAMPLES = {
-        "Projects by borough": """\
+# Module-level constants: compiled and interned once at import, not
+# re-allocated on every rerun. MappingProxyType keeps them read-only.
+# Literals live in params ($zip, $burden, …) so Neo4j's plan cache
+# keys on the query text and successive runs skip parse+plan.
+EXAMPLES = MappingProxyType({
+    "Projects by borough": ("""\
 MATCH (p:HousingProject)
 RETURN p.borough            AS borough,
        count(p)             AS projects,
        sum(p.total_units)   AS total_units
-ORDER BY projects DESC""",
+ORDER BY projects DESC""", {}),
 
-        "Neighbors of ZIP 10001": """\
-MATCH (z:ZipCode {zip_code: '10001'})-[r:NEIGHBORS]-(n:ZipCode)
+    "Neighbors of ZIP 10001": ("""\
+MATCH (z:ZipCode {zip_code: $zip})-[r:NEIGHBORS]-(n:ZipCode)
 RETURN n.zip_code           AS zip_code,
        n.borough            AS borough,
        r.shared_boundary_km AS shared_km
-ORDER BY n.zip_code""",
+ORDER BY n.zip_code""", {"zip": "10001"}),
 
-        "High rent-burden ZIPs": """\
+    "High rent-burden ZIPs": ("""\
 MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
-WHERE a.rent_burden_rate > 0.35
+WHERE a.rent_burden_rate > $burden
 RETURN z.zip_code          AS zip_code,
        z.borough           AS borough,
        a.rent_burden_rate  AS rent_burden,
        a.median_income_usd AS median_income
 ORDER BY a.rent_burden_rate DESC
-LIMIT 20""",
+LIMIT 20""", {"burden": 0.35}),
 
-        "Projects in high-burden tracts": """\
+    "Projects in high-burden tracts": ("""\
 MATCH (p:HousingProject)-[:IN_CENSUS_TRACT]->(r:RentBurden)
-WHERE r.severe_burden_rate > 0.40
+WHERE r.severe_burden_rate > $burden
 RETURN p.project_name      AS project,
        p.borough           AS borough,
        r.geo_id            AS tract_id,
        r.severe_burden_rate AS severe_burden
 ORDER BY r.severe_burden_rate DESC
-LIMIT 20""",
+LIMIT 20""", {"burden": 0.40}),
 
-        "ZIP affordability overview": """\
+    "ZIP affordability overview": ("""\
 MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
 RETURN z.zip_code          AS zip_code,
        z.borough           AS borough,
        a.median_income_usd AS median_income,
        a.rent_burden_rate  AS rent_burden,
        a.severe_burden_rate AS severe_burden
-ORDER BY z.borough, z.zip_code""",
-    }
+ORDER BY z.borough, z.zip_code""", {}),
+})
+
+EXAMPLE_NAMES = tuple(EXAMPLES)
+
+st.set_page_config(
+    page_title="Explore — NYC Housing Graph",
+    page_icon="🔎",
+    layout="wide",
+)
+inject_theme()
+
+with st.sidebar:
+    st.markdown(
+        '<span class="sidebar-brand">NYC Housing <span>Graph</span></span>',
+        unsafe_allow_html=True,
+    )
+    st.markdown("---")
+    st.caption("Write Cypher queries directly against the graph database.")
+
+st.markdown(
+    """
+    <div class="page-header">
+      <div class="page-title">Explore</div>
+      <div class="page-sub">Cypher query editor · schema reference · saved queries</div>
+    </div>
+    """,
+    unsafe_allow_html=True,
+)
+
+tab_editor, tab_graph, tab_saved, tab_schema = st.tabs(
+    ["Query Editor", "Graph View", "Saved Queries", "Schema Reference"]
+)
+
+# ── Tab 1: Query Editor ───────────────────────────────────────────────
+# Fragment: Run/Save/Load interactions rerun only this editor body, not
+# the graph/saved/schema tabs
+@st.fragment
+def _editor_tab() -> None:
 
     ex_col, _, load_col, __ = st.columns([3, 0.2, 1, 2])
     with ex_col:
-        selected = st.selectbox("Load example:", list(EXAMPLES.keys()), label_visibility="collapsed")
+        selected = st.selectbox("Load example:", EXAMPLE_NAMES, label_visibility="collapsed")
     with load_col:
         if st.button("Load →", use_container_width=True):
-            st.session_state["cypher_editor"] = EXAMPLES[selected]
+            ex_cypher, ex_params = EXAMPLES[selected]
+            st.session_state["cypher_editor"] = ex_cypher
+            st.session_state["cypher_params"] = (
+                json.dumps(ex_params) if ex_params else ""
+            )
 
     # Seed default on first load
     if "cypher_editor" not in st.session_state:
-        st.session_state["cypher_editor"] = EXAMPLES["Projects by borough"]
+        st.session_state["cypher_editor"] = EXAMPLES["Projects by borough"][0]
+
+    # Form: typing in the editor no longer reruns the whole page on
+    # every keystroke — only Run ▶ submits
+    with st.form("cypher_form", border=False):
+        cypher = st.text_area(
+            "Cypher",
+            height=170,
+            label_visibility="collapsed",
+            key="cypher_editor",
+        )
 
-    cypher = st.text_area(
-        "Cypher",
-        height=170,
-        label_visibility="collapsed",
-        key="cypher_editor",
-    )
+        params_text = st.text_input(
+            "Parameters (JSON)",
+            key="cypher_params",
+            placeholder='{"zip": "10001"}',
+            help="Bound as Cypher $parameters — keeps literals out of the "
+                 "query text so Neo4j can reuse the cached execution plan.",
+        )
+
+        run_col, opt1, opt2 = st.columns([1, 2, 1.4])
+        with run_col:
+            run_btn = st.form_submit_button(
+                "Run ▶", type="primary", use_container_width=True
+            )
+        with opt1:
+            use_parallel = st.checkbox(
+                "Parallel runtime (analytical reads)",
+                key="use_parallel",
+                help="Prepends CYPHER runtime=parallel so graph-wide aggregations "
+                     "use all cores. Applied to read-only queries only.",
+            )
+        with opt2:
+            bypass_cache = st.checkbox(
+                "Bypass cache",
+                key="bypass_cache",
+                help="Always execute against Neo4j, skipping the 5-minute "
+                     "result cache. Use when fresh data matters.",
+            )
 
-    run_col, save_col, name_col, _spacer = st.columns([1, 1, 2, 2])
-    with run_col:
-        run_btn = st.button("Run ▶", type="primary", use_container_width=True)
+    save_col, name_col, _spacer = st.columns([1, 2, 3])
     with name_col:
         save_name = st.text_input(
             "save_name",
@@ -124,16 +177,81 @@ ORDER BY z.borough, z.zip_code""",
         )
     with save_col:
         if st.button("Save ★", use_container_width=True):
-            name = save_name.strip() or f"Query {len(list_saved()) + 1}"
+            name = save_name.strip() or f"Query {len(_list_saved_cached()) + 1}"
             save_query(name, cypher)
+            _list_saved_cached.clear()
             st.toast(f'Saved "{name}"', icon="★")
 
+    _WRITE_CLAUSE_RE = re.compile(
+        r"\b(CREATE|MERGE|SET|DELETE|REMOVE|DROP)\b", re.IGNORECASE
+    )
+
+    # Hard cap on editor results: bounds memory and keeps accidental
+    # unbounded MATCHes from stalling the page. CSV export follows the cap.
+    MAX_ROWS = 5000
+
+    def _editor_run(
+        query_text: str, params_json: str = "", write: bool = False
+    ) -> tuple[list[dict], bool]:
+        """Execute an editor query, streaming and stopping at the row cap
+        instead of materializing the driver's full result buffer.
+
+        Parameters travel as a JSON string so the cached wrapper below
+        gets a hashable key. Writes must pass write=True — a READ-mode
+        session makes the server reject CREATE/MERGE/SET/DELETE.
+        """
+        params = json.loads(params_json) if params_json.strip() else {}
+        driver, config = _get_driver()
+        with driver.session(
+            database=config.target_db.database,
+            default_access_mode="WRITE" if write else "READ",
+        ) as session:
+            result = session.run(query_text, **params)
+            rows = []
+            truncated = False
+            for i, record in enumerate(result):
+                if i >= MAX_ROWS:
+                    truncated = True
+                    break
+                rows.append(record.data())
+        return rows, truncated
+
+    @st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+    def _cached_editor_run(query_text: str, params_json: str = "") -> tuple[list[dict], bool]:
+        """Cache editor results keyed on query text + params, so
+        re-running the same Cypher (double-clicks, example reloads)
+        returns from memory instead of a fresh round-trip."""
+        return _editor_run(query_text, params_json)
+
     if run_btn and cypher.strip():
         try:
+            query_text = cypher
+            is_read = not _WRITE_CLAUSE_RE.search(cypher)
+            # Server-side guard: un-LIMITed reads get a LIMIT appended so
+            # the planner can prune early instead of shipping every row to
+            # the driver for the client-side cap to discard.
+            if is_read and not re.search(r"\bLIMIT\b", cypher, re.IGNORECASE):
+                query_text = query_text.rstrip().rstrip(";") + f" LIMIT {MAX_ROWS}"
+                st.toast(f"Auto-added LIMIT {MAX_ROWS:,}")
+            # Parallel runtime only helps (and is only legal for) reads
+            if use_parallel and is_read:
+                query_text = "CYPHER runtime=parallel " + query_text
+
             t0 = time.time()
-            rows = run_query(cypher)
+            if not is_read:
+                # Writes skip both caches: a mutation must hit the server
+                # every time and must never be served from (or stored in)
+                # the result cache
+                rows, truncated = _editor_run(query_text, params_text, write=True)
+            elif bypass_cache:
+                rows, truncated = _editor_run(query_text, params_text)
+            else:
+                rows, truncated = _cached_editor_run(query_text, params_text)
             elapsed = round(time.time() - t0, 3)
-            st.session_state["_result"] = {"rows": rows, "elapsed": elapsed, "error": None}
+            st.session_state["_result"] = {
+                "rows": rows, "elapsed": elapsed,
+                "error": None, "truncated": truncated,
+            }
         except Exception as e:
             st.session_state["_result"] = {"rows": [], "elapsed": 0, "error": str(e)}
 
@@ -147,26 +265,75 @@ ORDER BY z.borough, z.zip_code""",
             )
         else:
             rows = cr["rows"]
-            st.markdown(
-                f'<div class="result-meta">'
-                f'{len(rows)} row{"s" if len(rows)!=1 else ""} &nbsp;·&nbsp; {cr["elapsed"]}s'
-                f'</div>',
-                unsafe_allow_html=True,
+            # st.caption over an HTML div: one plain-text element, no
+            # unsafe_allow_html sanitizer pass
+            st.caption(
+                f'{len(rows)} row{"s" if len(rows) != 1 else ""} · {cr["elapsed"]}s'
             )
+            if cr.get("truncated"):
+                st.caption(f"Result truncated at {MAX_ROWS:,} rows — add a LIMIT to narrow it.")
             if rows:
-                df = pd.DataFrame(rows)
-                st.dataframe(df, use_container_width=True, hide_index=True)
+                # Arrow-first: st.dataframe serializes to Arrow internally,
+                # so handing it a pyarrow.Table skips the pandas dtype
+                # inference pass entirely. Fall back to pandas for rows
+                # Arrow can't infer (e.g. heterogeneous columns).
+                is_arrow = True
+                try:
+                    import pyarrow as pa
+
+                    table = pa.Table.from_pylist(rows)
+                except Exception:
+                    import pandas as pd
+
+                    table = pd.DataFrame(rows)
+                    is_arrow = False
+
+                # Preview cap: huge grids freeze the browser tab; the CSV
+                # download below still carries the full result
+                PREVIEW_ROWS = 500
+                if len(rows) > PREVIEW_ROWS:
+                    preview = (
+                        table.slice(0, PREVIEW_ROWS) if is_arrow
+                        else table.head(PREVIEW_ROWS)
+                    )
+                    st.dataframe(preview, use_container_width=True, hide_index=True)
+                    st.caption(
+                        f"Showing {PREVIEW_ROWS:,} of {len(rows):,} rows — "
+                        "download CSV for the full result."
+                    )
+                else:
+                    st.dataframe(table, use_container_width=True, hide_index=True)
+
+                # Serialize once per result, not on every rerun
+                csv_bytes = cr.get("_csv")
+                if csv_bytes is None:
+                    import io
+
+                    buf = io.BytesIO()
+                    if is_arrow:
+                        from pyarrow import csv as pa_csv
+
+                        pa_csv.write_csv(table, buf)
+                    else:
+                        # Write bytes directly: skips the intermediate
+                        # str the no-arg to_csv would materialize
+                        table.to_csv(buf, index=False)
+                    csv_bytes = buf.getvalue()
+                    cr["_csv"] = csv_bytes
+
                 dl1, dl2, _sp = st.columns([1, 1, 4])
                 with dl1:
                     st.download_button(
                         "↓ CSV",
-                        df.to_csv(index=False),
+                        csv_bytes,
                         file_name="cypher_results.csv",
                         mime="text/csv",
                         use_container_width=True,
                     )
                 with dl2:
-                    geojson = rows_to_geojson(rows)
+                    if "_geojson" not in cr:
+                        cr["_geojson"] = rows_to_geojson(rows)
+                    geojson = cr["_geojson"]
                     st.download_button(
                         "↓ GeoJSON",
                         geojson or "{}",
@@ -179,6 +346,10 @@ ORDER BY z.borough, z.zip_code""",
             else:
                 st.info("No results.")
 
+
+with tab_editor:
+    _editor_tab()
+
 # ── Tab 2: Graph View ─────────────────────────────────────────────────
 with tab_graph:
     st.markdown("#### Visualize query results as an interactive network")
@@ -244,96 +415,99 @@ LIMIT 40""",
         help="Query must RETURN node variables and relationship variables, e.g. RETURN p, r, z",
     )
 
+    @st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+    def _render_graph_html(cypher: str) -> tuple:
+        """Run *cypher* and build the pyvis HTML once per query text.
+
+        Returns (status, html, n_nodes, n_edges) with status one of
+        "empty" (no records), "no_graph" (no node/rel values), "ok".
+        Cached so re-rendering the same query skips the Neo4j fetch,
+        the Python network build, and the HTML generation.
+        """
+        from pyvis.network import Network
+
+        driver, _ = _get_driver()
+        with driver.session() as session:
+            result = session.run(cypher)
+            records = list(result)
+            # The driver already deduplicates graph objects across records —
+            # no per-record isinstance walk or membership bookkeeping needed
+            graph = result.graph()
+
+        if not records:
+            return "empty", None, 0, 0
+
+        nodes = list(graph.nodes)
+        rels = list(graph.relationships)
+        if not nodes:
+            return "no_graph", None, 0, 0
+
+        net = Network(height="520px", width="100%",
+                      bgcolor="#F9F7F4", font_color="#333",
+                      notebook=False, directed=True)
+        net.barnes_hut(spring_length=120, spring_strength=0.04,
+                       damping=0.09, central_gravity=0.3)
+
+        # Per-node add_node (not the add_nodes batch API) because the
+        # batch call can't set the white node font
+        for node in nodes:
+            label = list(node.labels)[0] if node.labels else "Node"
+            name = (
+                node.get("project_name")
+                or node.get("zip_code")
+                or node.get("geo_id")
+                or f"{label}#{node.id}"
+            )
+            tip = f"<b>:{label}</b><br>" + "<br>".join(
+                f"{k}: {v}" for k, v in dict(node).items()
+                if v is not None
+            )
+            net.add_node(
+                node.id, label=str(name)[:24],
+                color=NODE_COLORS.get(label, "#888"),
+                size=NODE_SIZES.get(label, 15),
+                title=tip,
+                font={"color": "white", "size": 11},
+            )
+
+        for rel in rels:
+            net.add_edge(
+                rel.start_node.id, rel.end_node.id,
+                label=rel.type,
+                color="#999", font={"size": 9},
+                arrows="to",
+            )
+
+        # In-memory HTML generation — no tempfile write/read round-trip
+        html = net.generate_html(notebook=False)
+        return "ok", html, len(nodes), len(rels)
+
     if st.button("Render Graph ▶", type="primary", key="g_run"):
         if not graph_cypher.strip():
             st.warning("Enter a Cypher query above.")
         else:
             try:
-                from neo4j.graph import Node, Relationship
-                from pyvis.network import Network
-
                 with st.spinner("Fetching graph data…"):
-                    from utils.connection import _get_driver
-                    driver, _ = _get_driver()
-                    with driver.session() as session:
-                        result = session.run(graph_cypher)
-                        records = list(result)
+                    status, html, n_nodes, n_edges = _render_graph_html(graph_cypher)
 
-                if not records:
+                if status == "empty":
                     st.info("Query returned no results.")
+                elif status == "no_graph":
+                    st.warning(
+                        "No graph objects found. Make sure your query returns "
+                        "node/relationship variables (e.g. `RETURN p, r, z`), "
+                        "not just properties."
+                    )
                 else:
-                    net = Network(height="520px", width="100%",
-                                  bgcolor="#F9F7F4", font_color="#333",
-                                  notebook=False, directed=True)
-                    net.barnes_hut(spring_length=120, spring_strength=0.04,
-                                   damping=0.09, central_gravity=0.3)
-
-                    added_nodes: set = set()
-                    added_edges: set = set()
-
-                    def _add_node(node: "Node") -> None:
-                        if node.id in added_nodes:
-                            return
-                        label = list(node.labels)[0] if node.labels else "Node"
-                        name = (
-                            node.get("project_name")
-                            or node.get("zip_code")
-                            or node.get("geo_id")
-                            or f"{label}#{node.id}"
-                        )
-                        color = NODE_COLORS.get(label, "#888")
-                        size  = NODE_SIZES.get(label, 15)
-                        tip = f"<b>:{label}</b><br>" + "<br>".join(
-                            f"{k}: {v}" for k, v in dict(node).items()
-                            if v is not None
-                        )
-                        net.add_node(
-                            node.id, label=str(name)[:24],
-                            color=color, size=size, title=tip,
-                            font={"color": "white", "size": 11},
-                        )
-                        added_nodes.add(node.id)
-
-                    for record in records:
-                        for val in record.values():
-                            if isinstance(val, Node):
-                                _add_node(val)
-                            elif isinstance(val, Relationship):
-                                # Ensure both endpoint nodes exist before adding edge
-                                _add_node(val.start_node)
-                                _add_node(val.end_node)
-                                eid = val.id
-                                if eid not in added_edges:
-                                    net.add_edge(
-                                        val.start_node.id, val.end_node.id,
-                                        label=val.type,
-                                        color="#999", font={"size": 9},
-                                        arrows="to",
-                                    )
-                                    added_edges.add(eid)
-
-                    n_nodes = len(added_nodes)
-                    n_edges = len(added_edges)
-
-                    if n_nodes == 0:
-                        st.warning(
-                            "No graph objects found. Make sure your query returns "
-                            "node/relationship variables (e.g. `RETURN p, r, z`), "
-                            "not just properties."
-                        )
-                    else:
-                        st.caption(f"{n_nodes} nodes · {n_edges} edges — drag to explore, scroll to zoom, hover for details")
-                        with tempfile.NamedTemporaryFile(suffix=".html", delete=False) as f:
-                            net.save_graph(f.name)
-                            html = open(f.name).read()
-                        st.components.v1.html(html, height=540, scrolling=False)
+                    st.caption(f"{n_nodes} nodes · {n_edges} edges — drag to explore, scroll to zoom, hover for details")
+                    st.components.v1.html(html, height=540, scrolling=False)
 
             except Exception as e:
                 st.error(f"Graph rendering error: {e}")
 
 # ── Tab 3: Saved Queries ──────────────────────────────────────────────
 with tab_saved:
-    saved = list_saved()
+    saved = _list_saved_cached()
 
     if not saved:
         st.info("No saved queries yet. Write a query in the editor and click Save ★.")
@@ -350,112 +524,133 @@ with tab_saved:
                 with del_btn:
                     if st.button("Delete", key=f"del_{q['name']}"):
                         delete_query(q["name"])
+                        _list_saved_cached.clear()
                         st.rerun()
 
 # ── Tab 3: Schema Reference ───────────────────────────────────────────
+# The schema is static, so the reference panes are pre-built once into
+# two HTML blobs: one st.markdown per column instead of ~30 expander/
+# markdown elements re-emitted on every editor keystroke.
+
+
+@st.cache_data(show_spinner=False)
+def _schema_nodes_html() -> str:
+    nodes_info = [
+        (
+            "HousingProject",
+            "db_id",
+            "integer",
+            [
+                "project_id", "project_name", "building_id",
+                "house_number", "street_name", "borough", "postcode",
+                "bbl", "bin", "census_tract",
+                "total_units", "counted_rental_units",
+                "studio_units, one_br_units … six_br_units",
+                "low_income_units, extremely_low_income_units",
+                "moderate_income_units, middle_income_units",
+                "project_start_date, project_completion_date",
+                "center_lat, center_lon, area_km2",
+            ],
+        ),
+        (
+            "ZipCode",
+            "zip_code",
+            "string — 5-digit, e.g. '10001'",
+            ["borough", "center_lat", "center_lon", "area_km2"],
+        ),
+        (
+            "AffordabilityAnalysis",
+            "zip_code",
+            "string",
+            [
+                "median_income_usd",
+                "rent_burden_rate  (decimal, e.g. 0.35 = 35%)",
+                "severe_burden_rate",
+            ],
+        ),
+        (
+            "RentBurden",
+            "geo_id",
+            "string — Census GEOID",
+            [
+                "tract_name",
+                "rent_burden_rate",
+                "severe_burden_rate",
+                "center_lat, center_lon, area_km2",
+            ],
+        ),
+    ]
+
+    parts = []
+    for label, mk, mk_type, props in nodes_info:
+        prop_items = "".join(f"<li><code>{p}</code></li>" for p in props)
+        parts.append(
+            f"<details open><summary><strong>(:{label})</strong></summary>"
+            f"<p><strong>Merge key:</strong> <code>{mk}</code> — {mk_type}</p>"
+            f"<p><strong>Properties:</strong></p><ul>{prop_items}</ul>"
+            f"</details>"
+        )
+    return "".join(parts)
+
+
+@st.cache_data(show_spinner=False)
+def _schema_rels_html() -> str:
+    rels_info = [
+        (
+            "LOCATED_IN_ZIP",
+            "HousingProject", "ZipCode",
+            "–",
+            "FK: postcode → zip_code",
+        ),
+        (
+            "HAS_AFFORDABILITY_DATA",
+            "ZipCode", "AffordabilityAnalysis",
+            "–",
+            "FK: zip_code → zip_code",
+        ),
+        (
+            "IN_CENSUS_TRACT",
+            "HousingProject", "RentBurden",
+            "–",
+            "Computed: borough + census_tract → geo_id",
+        ),
+        (
+            "NEIGHBORS",
+            "ZipCode", "ZipCode",
+            "shared_boundary_km · is_touching",
+            "Spatial — undirected, use -[:NEIGHBORS]-",
+        ),
+        (
+            "CONTAINS_TRACT",
+            "ZipCode", "RentBurden",
+            "overlap_area_km2 · tract_coverage_ratio",
+            "Spatial intersection",
+        ),
+    ]
+
+    parts = []
+    for rel_type, from_lbl, to_lbl, props, note in rels_info:
+        body = f"<p><code>(:{from_lbl})-[:{rel_type}]->(:{to_lbl})</code></p>"
+        if props != "–":
+            body += f"<p><strong>Props:</strong> <code>{props}</code></p>"
+        body += f'<p style="font-size:0.85em;opacity:0.7">{note}</p>'
+        parts.append(
+            f"<details open><summary><strong>[:{rel_type}]</strong></summary>"
+            f"{body}</details>"
+        )
+    return "".join(parts)
+
+
 with tab_schema:
     n_col, r_col = st.columns(2)
 
     with n_col:
         st.markdown("#### Nodes")
-
-        nodes_info = [
-            (
-                "HousingProject",
-                "db_id",
-                "integer",
-                [
-                    "project_id", "project_name", "building_id",
-                    "house_number", "street_name", "borough", "postcode",
-                    "bbl", "bin", "census_tract",
-                    "total_units", "counted_rental_units",
-                    "studio_units, one_br_units … six_br_units",
-                    "low_income_units, extremely_low_income_units",
-                    "moderate_income_units, middle_income_units",
-                    "project_start_date, project_completion_date",
-                    "center_lat, center_lon, area_km2",
-                ],
-            ),
-            (
-                "ZipCode",
-                "zip_code",
-                "string — 5-digit, e.g. '10001'",
-                ["borough", "center_lat", "center_lon", "area_km2"],
-            ),
-            (
-                "AffordabilityAnalysis",
-                "zip_code",
-                "string",
-                [
-                    "median_income_usd",
-                    "rent_burden_rate  (decimal, e.g. 0.35 = 35%)",
-                    "severe_burden_rate",
-                ],
-            ),
-            (
-                "RentBurden",
-                "geo_id",
-                "string — Census GEOID",
-                [
-                    "tract_name",
-                    "rent_burden_rate",
-                    "severe_burden_rate",
-                    "center_lat, center_lon, area_km2",
-                ],
-            ),
-        ]
-
-        for label, mk, mk_type, props in nodes_info:
-            with st.expander(f"(:{label})", expanded=True):
-                st.markdown(f"**Merge key:** `{mk}` — {mk_type}")
-                st.markdown("**Properties:**")
-                for p in props:
-                    st.markdown(f"- `{p}`")
+        st.markdown(_schema_nodes_html(), unsafe_allow_html=True)
 
     with r_col:
         st.markdown("#### Relationships")
-
-        rels_info = [
-            (
-                "LOCATED_IN_ZIP",
-                "HousingProject", "ZipCode",
-                "–",
-                "FK: postcode → zip_code",
-            ),
-            (
-                "HAS_AFFORDABILITY_DATA",
-                "ZipCode", "AffordabilityAnalysis",
-                "–",
-                "FK: zip_code → zip_code",
-            ),
-            (
-                "IN_CENSUS_TRACT",
-                "HousingProject", "RentBurden",
-                "–",
-                "Computed: borough + census_tract → geo_id",
-            ),
-            (
-                "NEIGHBORS",
-                "ZipCode", "ZipCode",
-                "shared_boundary_km · is_touching",
-                "Spatial — undirected, use -[:NEIGHBORS]-",
-            ),
-            (
-                "CONTAINS_TRACT",
-                "ZipCode", "RentBurden",
-                "overlap_area_km2 · tract_coverage_ratio",
-                "Spatial intersection",
-            ),
-        ]
-
-        for rel_type, from_lbl, to_lbl, props, note in rels_info:
-            with st.expander(f"[:{rel_type}]", expanded=True):
-                st.markdown(
-                    f"`(:{from_lbl})-[:{rel_type}]->(:{to_lbl})`"
-                )
-                if props != "–":
-                    st.markdown(f"**Props:** `{props}`")
-                st.caption(note)
+        st.markdown(_schema_rels_html(), unsafe_allow_html=True)
 
         st.markdown("---")
         st.markdown("**Cypher tips**")
@@ -8,8 +8,11 @@ from pathlib import Path
 
 import streamlit as st
 import pandas as pd
+import plotly.express as px
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_APP_DIR = str(Path(__file__).parent.parent)
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
 from utils.theme import inject_theme
 from utils.connection import run_query
@@ -43,14 +46,47 @@ BOROUGHS = ["All", "Manhattan", "Brooklyn", "Queens", "Bronx", "Staten Island"]
 
 # ─── Helper ───────────────────────────────────────────────────────────────────
 
-def _run(cypher: str, params: dict) -> tuple[list[dict], float, str]:
-    """Execute query, return (rows, elapsed_s, cypher_shown)."""
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_run(cypher: str, params_key: tuple) -> list[dict]:
+    """Cache results per (query text, sorted params) for five minutes."""
+    return run_query(cypher, dict(params_key))
+
+
+def _run(
+    cypher: str, params: dict, schema: dict[str, str]
+) -> tuple[list[dict], float, str, dict[str, str]]:
+    """Execute query, return (rows, elapsed_s, cypher_shown, schema).
+
+    Repeat runs with the same parameters (the common case when a user
+    tweaks one control and re-runs) return from the cache instead of a
+    fresh Neo4j round-trip.
+
+    schema maps each RETURN alias to "num" or "txt" — the roles are
+    known when the Cypher is written, so result rendering never has to
+    introspect DataFrame dtypes.
+    """
     t0 = time.time()
-    rows = run_query(cypher, params)
-    return rows, round(time.time() - t0, 3), cypher
+    rows = _cached_run(cypher, tuple(sorted(params.items())))
+    return rows, round(time.time() - t0, 3), cypher, schema
+
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _has_neighbors2() -> bool:
+    """Whether scripts/materialize_neighbors2.py has been run on this graph.
 
-def _show_results(rows: list[dict], elapsed: float, cypher: str) -> None:
+    Count-store lookup, cached for an hour — the materialization is a
+    one-time offline step, not something that flips mid-session.
+    """
+    try:
+        rows = run_query("MATCH ()-[r:NEIGHBORS_2]->() RETURN count(r) AS c")
+        return bool(rows and rows[0]["c"])
+    except Exception:
+        return False
+
+
+def _show_results(
+    rows: list[dict], elapsed: float, cypher: str, schema: dict[str, str], key: str
+) -> None:
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
     with st.expander("Cypher", expanded=False):
@@ -70,35 +106,40 @@ def _show_results(rows: list[dict], elapsed: float, cypher: str) -> None:
 
     dl_col, _ = st.columns([1, 5])
     with dl_col:
-        st.download_button(
-            "↓ CSV", df.to_csv(index=False),
-            file_name="template_results.csv", mime="text/csv",
-        )
-
-    # Auto chart
-    num_cols = df.select_dtypes("number").columns.tolist()
-    txt_cols = df.select_dtypes("object").columns.tolist()
-    if num_cols and txt_cols and 2 <= len(df) <= 40:
-        try:
-            import plotly.express as px
-            fig = px.bar(
-                df, x=txt_cols[0], y=num_cols[0],
-                color_discrete_sequence=["#C1440E"],
-                template="plotly_white", text=num_cols[0],
-            )
-            fig.update_traces(textposition="outside")
-            fig.update_layout(
-                height=320, margin=dict(t=16, b=0, l=0, r=0),
-                xaxis_title="", yaxis_title=num_cols[0],
-                font_family="Inter",
-                plot_bgcolor="#F9F7F4", paper_bgcolor="#F9F7F4",
+        # CSV serialization is CPU-bound on large results, so the string
+        # is only built once the user opts in — not on every render
+        if st.checkbox("Prepare CSV", key=f"{key}_csv"):
+            st.download_button(
+                "↓ CSV", df.to_csv(index=False),
+                file_name="template_results.csv", mime="text/csv",
+                key=f"{key}_dl",
             )
-            st.plotly_chart(fig, use_container_width=True)
-        except Exception:
-            pass
+
+    # Auto chart — results past 40 rows chart their top 40 by the first
+    # numeric column rather than skipping the chart entirely. Column
+    # roles come from the declared schema, not dtype introspection
+    num_cols = [c for c, t in schema.items() if t == "num"]
+    txt_cols = [c for c, t in schema.items() if t == "txt"]
+    if num_cols and txt_cols and len(df) >= 2:
+        chart_df = df if len(df) <= 40 else df.nlargest(40, num_cols[0])
+        fig = px.bar(
+            chart_df, x=txt_cols[0], y=num_cols[0],
+            color_discrete_sequence=["#C1440E"],
+            template="plotly_white", text=num_cols[0],
+        )
+        fig.update_traces(textposition="outside")
+        fig.update_layout(
+            height=320, margin=dict(t=16, b=0, l=0, r=0),
+            xaxis_title="", yaxis_title=num_cols[0],
+            font_family="Inter",
+            plot_bgcolor="#F9F7F4", paper_bgcolor="#F9F7F4",
+        )
+        st.plotly_chart(fig, use_container_width=True, key=f"{key}_chart")
 
 
 # ─── Template tabs ────────────────────────────────────────────────────────────
+# Each tab body is a fragment: running or tweaking one template reruns
+# only that function, not the whole page (and not the other four tabs)
 
 t1, t2, t3, t4, t5 = st.tabs([
     "① Rent Burden by Borough",
@@ -109,11 +150,12 @@ t1, t2, t3, t4, t5 = st.tabs([
 ])
 
 # ── Template 1: Rent burden filter by borough ─────────────────────────────────
-with t1:
+@st.fragment
+def _t1_tab() -> None:
     st.markdown("#### ZIP codes with rent burden above threshold")
     st.caption("Filter by borough and rent burden rate. Returns ZIP codes sorted by burden.")
 
-    c1, c2, c3 = st.columns([2, 2, 1])
+    c1, c2, c3, c4 = st.columns([2, 2, 1, 1])
     with c1:
         t1_borough = st.selectbox("Borough", BOROUGHS, key="t1_borough")
     with c2:
@@ -121,40 +163,67 @@ with t1:
             "Rent burden threshold (%)", 20, 55, 35, step=5, key="t1_threshold"
         )
     with c3:
+        t1_max = st.number_input(
+            "Max rows", min_value=100, max_value=5000, value=500, step=100,
+            key="t1_max",
+        )
+    with c4:
         st.markdown("<br>", unsafe_allow_html=True)
         t1_run = st.button("Run ▶", type="primary", use_container_width=True, key="t1_run")
 
     if t1_run:
         threshold = t1_threshold / 100.0
+        # LIMIT keeps unbounded all-borough runs from shipping every ZIP
+        # over the wire when the page shows far fewer
         if t1_borough == "All":
+            # Indexed range seek on the filtered side first (cf. Template 3)
             cypher = """
-MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
+MATCH (a:AffordabilityAnalysis)
 WHERE a.rent_burden_rate > $threshold
+WITH a
+MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a)
 RETURN z.borough           AS borough,
        z.zip_code          AS zip_code,
        a.rent_burden_rate  AS rent_burden_rate,
        a.severe_burden_rate AS severe_burden_rate,
        a.median_income_usd AS median_income_usd
 ORDER BY a.rent_burden_rate DESC
+LIMIT $max_rows
 """
-            params = {"threshold": threshold}
+            params = {"threshold": threshold, "max_rows": int(t1_max)}
         else:
             cypher = """
-MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
-WHERE z.borough = $borough AND a.rent_burden_rate > $threshold
+MATCH (z:ZipCode {borough: $borough})-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
+WHERE a.rent_burden_rate > $threshold
 RETURN z.zip_code          AS zip_code,
        a.rent_burden_rate  AS rent_burden_rate,
        a.severe_burden_rate AS severe_burden_rate,
        a.median_income_usd AS median_income_usd
 ORDER BY a.rent_burden_rate DESC
+LIMIT $max_rows
 """
-            params = {"borough": t1_borough, "threshold": threshold}
-
-        rows, elapsed, q = _run(cypher, params)
-        _show_results(rows, elapsed, q)
+            params = {
+                "borough": t1_borough,
+                "threshold": threshold,
+                "max_rows": int(t1_max),
+            }
+
+        schema = {
+            **({"borough": "txt"} if t1_borough == "All" else {}),
+            "zip_code": "txt",
+            "rent_burden_rate": "num",
+            "severe_burden_rate": "num",
+            "median_income_usd": "num",
+        }
+        # Results persist in session state so they survive reruns (e.g.
+        # toggling the CSV checkbox) instead of vanishing with the button
+        st.session_state["t1_result"] = _run(cypher, params, schema)
+    if "t1_result" in st.session_state:
+        _show_results(*st.session_state["t1_result"], key="t1")
 
 # ── Template 2: Projects in neighboring ZIPs ──────────────────────────────────
-with t2:
+@st.fragment
+def _t2_tab() -> None:
     st.markdown("#### Housing projects in ZIP codes neighboring a target")
     st.caption(
         "Enter a 5-digit ZIP code to find all housing projects in adjacent ZIP codes. "
@@ -190,6 +259,19 @@ RETURN p.project_name  AS project_name,
        n.zip_code       AS neighbor_zip
 ORDER BY p.total_units DESC
 LIMIT 100
+"""
+            elif _has_neighbors2():
+                # Materialized 2-hop adjacency (scripts/materialize_neighbors2.py):
+                # single-hop lookup instead of a variable-length expansion
+                cypher = """
+MATCH (z:ZipCode {zip_code: $zip_code})-[:NEIGHBORS_2]-(n:ZipCode)
+      <-[:LOCATED_IN_ZIP]-(p:HousingProject)
+RETURN p.project_name  AS project_name,
+       p.borough        AS borough,
+       p.total_units    AS total_units,
+       n.zip_code       AS neighbor_zip
+ORDER BY p.total_units DESC
+LIMIT 100
 """
             else:
                 cypher = """
@@ -203,11 +285,21 @@ RETURN DISTINCT p.project_name AS project_name,
 ORDER BY p.total_units DESC
 LIMIT 100
 """
-            rows, elapsed, q = _run(cypher, {"zip_code": t2_zip.strip()})
-            _show_results(rows, elapsed, q)
+            schema = {
+                "project_name": "txt",
+                "borough": "txt",
+                "total_units": "num",
+                "neighbor_zip": "txt",
+            }
+            st.session_state["t2_result"] = _run(
+                cypher, {"zip_code": t2_zip.strip()}, schema
+            )
+    if "t2_result" in st.session_state:
+        _show_results(*st.session_state["t2_result"], key="t2")
 
 # ── Template 3: Census tracts with high burden ────────────────────────────────
-with t3:
+@st.fragment
+def _t3_tab() -> None:
     st.markdown("#### Housing projects in high-burden census tracts")
     st.caption("Find projects located in census tracts with severe rent burden above threshold.")
 
@@ -224,10 +316,16 @@ with t3:
 
     if t3_run:
         threshold = t3_threshold / 100.0
+        # Lead with the threshold-filtered RentBurden side: an indexed
+        # range seek over the few qualifying tracts, then expand to
+        # their projects — rather than scanning every HousingProject
+        # and filtering after the join
         if t3_borough == "All":
             cypher = """
-MATCH (p:HousingProject)-[:IN_CENSUS_TRACT]->(r:RentBurden)
+MATCH (r:RentBurden)
 WHERE r.severe_burden_rate > $threshold
+WITH r
+MATCH (p:HousingProject)-[:IN_CENSUS_TRACT]->(r)
 RETURN p.project_name        AS project_name,
        p.borough              AS borough,
        p.total_units          AS total_units,
@@ -239,8 +337,10 @@ LIMIT 100
             params = {"threshold": threshold}
         else:
             cypher = """
-MATCH (p:HousingProject)-[:IN_CENSUS_TRACT]->(r:RentBurden)
-WHERE p.borough = $borough AND r.severe_burden_rate > $threshold
+MATCH (r:RentBurden)
+WHERE r.severe_burden_rate > $threshold
+WITH r
+MATCH (p:HousingProject {borough: $borough})-[:IN_CENSUS_TRACT]->(r)
 RETURN p.project_name        AS project_name,
        p.total_units          AS total_units,
        r.geo_id               AS tract_id,
@@ -250,11 +350,20 @@ LIMIT 100
 """
             params = {"borough": t3_borough, "threshold": threshold}
 
-        rows, elapsed, q = _run(cypher, params)
-        _show_results(rows, elapsed, q)
+        schema = {
+            "project_name": "txt",
+            **({"borough": "txt"} if t3_borough == "All" else {}),
+            "total_units": "num",
+            "tract_id": "txt",
+            "severe_burden_rate": "num",
+        }
+        st.session_state["t3_result"] = _run(cypher, params, schema)
+    if "t3_result" in st.session_state:
+        _show_results(*st.session_state["t3_result"], key="t3")
 
 # ── Template 4: Borough comparison ───────────────────────────────────────────
-with t4:
+@st.fragment
+def _t4_tab() -> None:
     st.markdown("#### Compare indicators across boroughs")
     st.caption("Aggregate any affordability indicator by borough via ZIP codes.")
 
@@ -273,28 +382,42 @@ with t4:
 
     if t4_run:
         field, is_pct = INDICATORS[t4_ind]
-        cypher = f"""
+        # CASE selector keeps the query text identical for all three
+        # indicators, so Neo4j's plan cache (keyed on exact text) hits
+        # instead of re-planning per indicator
+        # Percent conversion happens in the projection — no Python
+        # post-processing loop over the result rows
+        cypher = """
 MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
-WHERE a.{field} IS NOT NULL
-RETURN z.borough              AS borough,
-       avg(a.{field})         AS avg_value,
-       min(a.{field})         AS min_value,
-       max(a.{field})         AS max_value,
-       count(z)               AS zip_count
+WITH z, CASE $field
+         WHEN 'rent_burden_rate'   THEN a.rent_burden_rate
+         WHEN 'severe_burden_rate' THEN a.severe_burden_rate
+         ELSE a.median_income_usd
+       END AS value
+WHERE value IS NOT NULL
+RETURN z.borough AS borough,
+       CASE WHEN $pct THEN round(avg(value) * 100, 1) ELSE avg(value) END AS avg_value,
+       CASE WHEN $pct THEN round(min(value) * 100, 1) ELSE min(value) END AS min_value,
+       CASE WHEN $pct THEN round(max(value) * 100, 1) ELSE max(value) END AS max_value,
+       count(z) AS zip_count
 ORDER BY avg_value DESC
 """
-        rows, elapsed, q = _run(cypher, {})
-        if rows:
-            # Convert to percentage if needed
-            if is_pct:
-                for r in rows:
-                    for k in ("avg_value", "min_value", "max_value"):
-                        if r[k] is not None:
-                            r[k] = round(r[k] * 100, 1)
-        _show_results(rows, elapsed, q)
+        schema = {
+            "borough": "txt",
+            "avg_value": "num",
+            "min_value": "num",
+            "max_value": "num",
+            "zip_count": "num",
+        }
+        st.session_state["t4_result"] = _run(
+            cypher, {"field": field, "pct": is_pct}, schema
+        )
+    if "t4_result" in st.session_state:
+        _show_results(*st.session_state["t4_result"], key="t4")
 
 # ── Template 5: Top N projects ────────────────────────────────────────────────
-with t5:
+@st.fragment
+def _t5_tab() -> None:
     st.markdown("#### Top housing projects by size metric")
     st.caption("Rank projects within a borough by total units, low-income units, or other metrics.")
 
@@ -318,32 +441,62 @@ with t5:
 
     if t5_run:
         field = METRICS[t5_metric]
+        # Same CASE-selector trick as Template 4: one stable query text
+        # per borough mode, whatever the chosen metric
+        _metric_case = """CASE $field
+         WHEN 'total_units'                THEN p.total_units
+         WHEN 'low_income_units'           THEN p.low_income_units
+         WHEN 'extremely_low_income_units' THEN p.extremely_low_income_units
+         ELSE p.moderate_income_units
+       END"""
         if t5_borough == "All":
             cypher = f"""
 MATCH (p:HousingProject)
-WHERE p.{field} IS NOT NULL
+WITH p, {_metric_case} AS metric
+WHERE metric IS NOT NULL
 RETURN p.project_name   AS project_name,
        p.borough         AS borough,
        p.postcode        AS zip_code,
        p.total_units     AS total_units,
-       p.{field}         AS {field}
-ORDER BY p.{field} DESC
+       metric            AS value
+ORDER BY metric DESC
 LIMIT $n
 """
         else:
             cypher = f"""
-MATCH (p:HousingProject)
-WHERE p.borough = $borough AND p.{field} IS NOT NULL
+MATCH (p:HousingProject {{borough: $borough}})
+WITH p, {_metric_case} AS metric
+WHERE metric IS NOT NULL
 RETURN p.project_name   AS project_name,
        p.postcode        AS zip_code,
        p.total_units     AS total_units,
-       p.{field}         AS {field}
-ORDER BY p.{field} DESC
+       metric            AS value
+ORDER BY metric DESC
 LIMIT $n
 """
-        params = {"n": int(t5_n)}
+        params = {"n": int(t5_n), "field": field}
         if t5_borough != "All":
             params["borough"] = t5_borough
 
-        rows, elapsed, q = _run(cypher, params)
-        _show_results(rows, elapsed, q)
+        schema = {
+            "project_name": "txt",
+            **({"borough": "txt"} if t5_borough == "All" else {}),
+            "zip_code": "txt",
+            "total_units": "num",
+            "value": "num",
+        }
+        st.session_state["t5_result"] = _run(cypher, params, schema)
+    if "t5_result" in st.session_state:
+        _show_results(*st.session_state["t5_result"], key="t5")
+
+
+with t1:
+    _t1_tab()
+with t2:
+    _t2_tab()
+with t3:
+    _t3_tab()
+with t4:
+    _t4_tab()
+with t5:
+    _t5_tab()
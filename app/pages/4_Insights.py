@@ -10,7 +10,9 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_APP_DIR = str(Path(__file__).parent.parent)
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
 from utils.theme import inject_theme
 from utils.connection import run_query
@@ -49,24 +51,281 @@ st.markdown(
 
 
 # ────────────────────────────────────────────────────────────────────
-# Helper: run a cached query and return a DataFrame
+# Fused data fetch: all five section queries travel in one statement
+# (CALL {} subqueries joined by UNION ALL, each collecting its rows),
+# so a cold page load costs one Bolt round-trip instead of five.
+# The two borough-level aggregate sections come in a second flavour
+# that reads materialized BoroughStats nodes — written offline by
+# scripts/refresh_borough_stats.py — instead of re-scanning the graph
+# on every cache expiry. The per-ZIP sections always run live.
 # ────────────────────────────────────────────────────────────────────
+_BOROUGH_SECTIONS_LIVE = """
+CALL {
+    MATCH (p:HousingProject)
+    WITH p.borough AS borough, count(p) AS projects, sum(p.total_units) AS total_units
+    ORDER BY projects DESC
+    RETURN collect({borough: borough, projects: projects,
+                    total_units: total_units}) AS rows
+}
+RETURN 'borough' AS section, rows
+UNION ALL
+CALL {
+    MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
+    WHERE a.rent_burden_rate IS NOT NULL
+    WITH z.borough                       AS borough,
+         avg(a.rent_burden_rate) * 100   AS avg_rent_burden_pct,
+         avg(a.severe_burden_rate) * 100 AS avg_severe_burden_pct,
+         avg(a.median_income_usd)        AS avg_income,
+         count(z)                        AS zip_count
+    ORDER BY avg_rent_burden_pct DESC
+    RETURN collect({borough: borough, avg_rent_burden_pct: avg_rent_burden_pct,
+                    avg_severe_burden_pct: avg_severe_burden_pct,
+                    avg_income: avg_income, zip_count: zip_count}) AS rows
+}
+RETURN 'burden' AS section, rows
+"""
+
+_BOROUGH_SECTIONS_MATERIALIZED = """
+CALL {
+    MATCH (b:BoroughStats)
+    WITH b ORDER BY b.projects DESC
+    RETURN collect({borough: b.borough, projects: b.projects,
+                    total_units: b.total_units}) AS rows
+}
+RETURN 'borough' AS section, rows
+UNION ALL
+CALL {
+    MATCH (b:BoroughStats)
+    WITH b ORDER BY b.avg_rent_burden_pct DESC
+    RETURN collect({borough: b.borough, avg_rent_burden_pct: b.avg_rent_burden_pct,
+                    avg_severe_burden_pct: b.avg_severe_burden_pct,
+                    avg_income: b.avg_income, zip_count: b.zip_count}) AS rows
+}
+RETURN 'burden' AS section, rows
+"""
+
+_ZIP_SECTIONS = """
+UNION ALL
+CALL {
+    MATCH (p:HousingProject)-[:LOCATED_IN_ZIP]->(z:ZipCode)
+    WITH z.zip_code AS zip_code, z.borough AS borough,
+         count(p) AS projects, sum(p.total_units) AS total_units
+    ORDER BY projects DESC
+    LIMIT 25
+    RETURN collect({zip_code: zip_code, borough: borough,
+                    projects: projects, total_units: total_units}) AS rows
+}
+RETURN 'zips' AS section, rows
+UNION ALL
+CALL {
+    MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
+    OPTIONAL MATCH (p:HousingProject)-[:LOCATED_IN_ZIP]->(z)
+    WITH z, a, count(p) AS project_count
+    WHERE a.median_income_usd IS NOT NULL
+      AND a.rent_burden_rate  IS NOT NULL
+    RETURN collect({zip_code: z.zip_code, borough: z.borough,
+                    median_income: a.median_income_usd,
+                    rent_burden_pct: a.rent_burden_rate * 100,
+                    severe_burden_pct: a.severe_burden_rate * 100,
+                    project_count: project_count}) AS rows
+}
+RETURN 'scatter' AS section, rows
+UNION ALL
+CALL {
+    MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
+    WHERE a.rent_burden_rate IS NOT NULL
+    RETURN collect({borough: z.borough,
+                    rent_burden_pct: a.rent_burden_rate * 100}) AS rows
+}
+RETURN 'hist' AS section, rows
+"""
+
+
+# Known RETURN columns per section: passing them explicitly skips the
+# pandas column-discovery scan, keeps order stable on empty results,
+# and lets borough become categorical (~6 bytes/row vs a Python str)
+_SECTION_COLUMNS = {
+    "borough": ("borough", "projects", "total_units"),
+    "burden":  ("borough", "avg_rent_burden_pct", "avg_severe_burden_pct",
+                "avg_income", "zip_count"),
+    "zips":    ("zip_code", "borough", "projects", "total_units"),
+    "scatter": ("zip_code", "borough", "median_income", "rent_burden_pct",
+                "severe_burden_pct", "project_count"),
+    "hist":    ("borough", "rent_burden_pct"),
+}
+
+
+def _frame(section: str, rows: list[dict]) -> pd.DataFrame:
+    df = pd.DataFrame.from_records(rows, columns=_SECTION_COLUMNS.get(section))
+    if "borough" in df.columns:
+        df["borough"] = df["borough"].astype("category")
+    return df
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _has_borough_stats() -> bool:
+    """Whether scripts/refresh_borough_stats.py has populated the graph.
+
+    Count-store lookup, cached for an hour — the refresh is an offline
+    cron step, not something that flips mid-session.
+    """
+    try:
+        rows = run_query("MATCH (b:BoroughStats) RETURN count(b) AS c")
+        return bool(rows and rows[0]["c"])
+    except Exception:
+        return False
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _sections() -> dict[str, pd.DataFrame]:
+    head = (
+        _BOROUGH_SECTIONS_MATERIALIZED
+        if _has_borough_stats()
+        else _BOROUGH_SECTIONS_LIVE
+    )
+    return {
+        row["section"]: _frame(row["section"], row["rows"])
+        for row in run_query(head + _ZIP_SECTIONS)
+    }
+
+
+# ────────────────────────────────────────────────────────────────────
+# Cached figure builders: unchanged DataFrames reuse the built Figure,
+# and the stable key= on each st.plotly_chart lets the frontend diff
+# the existing plot instead of replacing the div
+# ────────────────────────────────────────────────────────────────────
+# plotGlPixelRatio=1 caps WebGL fragment work on high-DPI screens
+_PLOTLY_CONFIG = {"displayModeBar": False, "plotGlPixelRatio": 1}
+
+_LAYOUT_COMMON = dict(
+    margin=dict(t=10, b=0, l=0, r=0),
+    font_family="Inter",
+    plot_bgcolor="#F9F7F4",
+    paper_bgcolor="#F9F7F4",
+)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fig_borough_bar(df: pd.DataFrame) -> go.Figure:
+    fig = px.bar(
+        df,
+        x="borough", y="projects",
+        color="borough",
+        color_discrete_sequence=PALETTE,
+        template="plotly_white",
+        text="projects",
+        labels={"projects": "Projects", "borough": ""},
+    )
+    fig.update_traces(textposition="outside")
+    fig.update_layout(showlegend=False, height=280, **_LAYOUT_COMMON)
+    return fig
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fig_burden_bar(df: pd.DataFrame) -> go.Figure:
+    fig = px.bar(
+        df,
+        x="borough", y="avg_rent_burden_pct",
+        color_discrete_sequence=[ORANGE],
+        template="plotly_white",
+        text="avg_rent_burden_pct",
+        labels={"avg_rent_burden_pct": "Avg rent burden (%)"},
+    )
+    fig.update_traces(texttemplate="%{text}%", textposition="outside")
+    fig.update_layout(height=280, showlegend=False, xaxis_title="", **_LAYOUT_COMMON)
+    return fig
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fig_income_bar(df: pd.DataFrame) -> go.Figure:
+    fig = px.bar(
+        df,
+        x="borough", y="avg_income",
+        color_discrete_sequence=[TAN],
+        template="plotly_white",
+        text="avg_income",
+        labels={"avg_income": "Avg median income ($)"},
+    )
+    fig.update_traces(texttemplate="$%{text:,}", textposition="outside")
+    fig.update_layout(height=280, showlegend=False, xaxis_title="", **_LAYOUT_COMMON)
+    return fig
+
+
 @st.cache_data(ttl=300, show_spinner=False)
-def _q(cypher: str) -> pd.DataFrame:
-    rows = run_query(cypher)
-    return pd.DataFrame(rows) if rows else pd.DataFrame()
+def _fig_top_zips(df: pd.DataFrame) -> go.Figure:
+    fig = px.bar(
+        df.sort_values("projects"),
+        x="projects", y="label",
+        orientation="h",
+        color="borough",
+        color_discrete_sequence=PALETTE,
+        template="plotly_white",
+        labels={"projects": "Housing Projects", "label": ""},
+    )
+    fig.update_layout(height=520, legend_title="Borough", **_LAYOUT_COMMON)
+    return fig
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fig_scatter(df: pd.DataFrame) -> go.Figure:
+    # WebGL trace (scattergl): per-ZIP bubbles paint on the GPU, so the
+    # chart stays smooth as the ZIP count grows
+    fig = px.scatter(
+        df,
+        x="median_income",
+        y="rent_burden_pct",
+        color="borough",
+        size="project_count",
+        size_max=28,
+        render_mode="webgl",
+        hover_data=["zip_code", "severe_burden_pct", "project_count"],
+        color_discrete_sequence=PALETTE,
+        template="plotly_white",
+        labels={
+            "median_income":   "Median Household Income ($)",
+            "rent_burden_pct": "Rent Burden (%)",
+            "borough":         "Borough",
+        },
+    )
+    # Reference line at 30% burden
+    fig.add_hline(
+        y=30,
+        line_dash="dot",
+        line_color="#AAA",
+        annotation_text="30% burden threshold",
+        annotation_position="right",
+    )
+    fig.update_layout(height=420, **_LAYOUT_COMMON)
+    return fig
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fig_histogram(df: pd.DataFrame) -> go.Figure:
+    fig = px.histogram(
+        df,
+        x="rent_burden_pct",
+        color="borough",
+        nbins=20,
+        opacity=0.75,
+        barmode="overlay",
+        color_discrete_sequence=PALETTE,
+        template="plotly_white",
+        labels={"rent_burden_pct": "Rent Burden (%)", "count": "ZIP Codes"},
+    )
+    fig.add_vline(
+        x=30,
+        line_dash="dot",
+        line_color="#444",
+        annotation_text="30%",
+    )
+    fig.update_layout(height=300, legend_title="Borough", **_LAYOUT_COMMON)
+    return fig
 
 
 # ── Section 1: Projects by borough ───────────────────────────────────
 st.markdown("#### Housing Projects by Borough")
 
-df_borough = _q("""
-    MATCH (p:HousingProject)
-    RETURN p.borough          AS borough,
-           count(p)           AS projects,
-           sum(p.total_units) AS total_units
-    ORDER BY projects DESC
-""")
+df_borough = _sections().get("borough", pd.DataFrame())
 
 if not df_borough.empty:
     df_borough["total_units"] = df_borough["total_units"].fillna(0).astype(int)
@@ -85,25 +344,12 @@ if not df_borough.empty:
         )
 
     with chart_col:
-        fig = px.bar(
-            df_borough,
-            x="borough", y="projects",
-            color="borough",
-            color_discrete_sequence=PALETTE,
-            template="plotly_white",
-            text="projects",
-            labels={"projects": "Projects", "borough": ""},
-        )
-        fig.update_traces(textposition="outside")
-        fig.update_layout(
-            showlegend=False,
-            height=280,
-            margin=dict(t=10, b=0, l=0, r=0),
-            font_family="Inter",
-            plot_bgcolor="#F9F7F4",
-            paper_bgcolor="#F9F7F4",
+        st.plotly_chart(
+            _fig_borough_bar(df_borough),
+            use_container_width=True,
+            key="fig_borough",
+            config=_PLOTLY_CONFIG,
         )
-        st.plotly_chart(fig, use_container_width=True)
 
 st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
@@ -111,16 +357,7 @@ st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 st.markdown("#### Rent Burden & Median Income by Borough")
 st.caption("Average across ZIP codes with affordability data")
 
-df_burden = _q("""
-    MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
-    WHERE a.rent_burden_rate IS NOT NULL
-    RETURN z.borough                      AS borough,
-           avg(a.rent_burden_rate) * 100  AS avg_rent_burden_pct,
-           avg(a.severe_burden_rate) * 100 AS avg_severe_burden_pct,
-           avg(a.median_income_usd)       AS avg_income,
-           count(z)                       AS zip_count
-    ORDER BY avg_rent_burden_pct DESC
-""")
+df_burden = _sections().get("burden", pd.DataFrame())
 
 if not df_burden.empty:
     df_burden["avg_rent_burden_pct"]    = df_burden["avg_rent_burden_pct"].round(1)
@@ -130,84 +367,40 @@ if not df_burden.empty:
     b1, b2 = st.columns(2)
 
     with b1:
-        fig2 = px.bar(
-            df_burden,
-            x="borough", y="avg_rent_burden_pct",
-            color_discrete_sequence=[ORANGE],
-            template="plotly_white",
-            text="avg_rent_burden_pct",
-            labels={"avg_rent_burden_pct": "Avg rent burden (%)"},
-        )
-        fig2.update_traces(texttemplate="%{text}%", textposition="outside")
-        fig2.update_layout(
-            height=280, showlegend=False,
-            margin=dict(t=10, b=0, l=0, r=0),
-            xaxis_title="",
-            font_family="Inter",
-            plot_bgcolor="#F9F7F4",
-            paper_bgcolor="#F9F7F4",
-        )
         st.caption("% of households spending >30% of income on rent")
-        st.plotly_chart(fig2, use_container_width=True)
+        st.plotly_chart(
+            _fig_burden_bar(df_burden),
+            use_container_width=True,
+            key="fig_burden",
+            config=_PLOTLY_CONFIG,
+        )
 
     with b2:
-        fig3 = px.bar(
-            df_burden,
-            x="borough", y="avg_income",
-            color_discrete_sequence=[TAN],
-            template="plotly_white",
-            text="avg_income",
-            labels={"avg_income": "Avg median income ($)"},
-        )
-        fig3.update_traces(texttemplate="$%{text:,}", textposition="outside")
-        fig3.update_layout(
-            height=280, showlegend=False,
-            margin=dict(t=10, b=0, l=0, r=0),
-            xaxis_title="",
-            font_family="Inter",
-            plot_bgcolor="#F9F7F4",
-            paper_bgcolor="#F9F7F4",
-        )
         st.caption("Average ZIP-level median household income")
-        st.plotly_chart(fig3, use_container_width=True)
+        st.plotly_chart(
+            _fig_income_bar(df_burden),
+            use_container_width=True,
+            key="fig_income",
+            config=_PLOTLY_CONFIG,
+        )
 
 st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
 # ── Section 3: Top ZIPs by project count ──────────────────────────────
 st.markdown("#### Top 25 ZIP Codes by Housing Projects")
 
-df_zips = _q("""
-    MATCH (p:HousingProject)-[:LOCATED_IN_ZIP]->(z:ZipCode)
-    RETURN z.zip_code         AS zip_code,
-           z.borough          AS borough,
-           count(p)           AS projects,
-           sum(p.total_units) AS total_units
-    ORDER BY projects DESC
-    LIMIT 25
-""")
+df_zips = _sections().get("zips", pd.DataFrame())
 
 if not df_zips.empty:
     df_zips["total_units"] = df_zips["total_units"].fillna(0).astype(int)
     df_zips["label"] = df_zips["zip_code"] + " (" + df_zips["borough"].str[:3] + ")"
 
-    fig4 = px.bar(
-        df_zips.sort_values("projects"),
-        x="projects", y="label",
-        orientation="h",
-        color="borough",
-        color_discrete_sequence=PALETTE,
-        template="plotly_white",
-        labels={"projects": "Housing Projects", "label": ""},
-    )
-    fig4.update_layout(
-        height=520,
-        margin=dict(t=10, b=0, l=0, r=0),
-        font_family="Inter",
-        legend_title="Borough",
-        plot_bgcolor="#F9F7F4",
-        paper_bgcolor="#F9F7F4",
+    st.plotly_chart(
+        _fig_top_zips(df_zips),
+        use_container_width=True,
+        key="fig_zips",
+        config=_PLOTLY_CONFIG,
     )
-    st.plotly_chart(fig4, use_container_width=True)
 
 st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
@@ -219,94 +412,31 @@ st.caption(
     "Hover for details."
 )
 
-df_scatter = _q("""
-    MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
-    OPTIONAL MATCH (p:HousingProject)-[:LOCATED_IN_ZIP]->(z)
-    WITH z, a, count(p) AS project_count
-    WHERE a.median_income_usd IS NOT NULL
-      AND a.rent_burden_rate  IS NOT NULL
-    RETURN z.zip_code                   AS zip_code,
-           z.borough                    AS borough,
-           a.median_income_usd          AS median_income,
-           a.rent_burden_rate  * 100    AS rent_burden_pct,
-           a.severe_burden_rate * 100   AS severe_burden_pct,
-           project_count
-""")
+df_scatter = _sections().get("scatter", pd.DataFrame())
 
 if not df_scatter.empty:
     df_scatter["project_count"]     = df_scatter["project_count"].fillna(0).astype(int)
     df_scatter["rent_burden_pct"]   = df_scatter["rent_burden_pct"].round(1)
     df_scatter["severe_burden_pct"] = df_scatter["severe_burden_pct"].round(1)
 
-    fig5 = px.scatter(
-        df_scatter,
-        x="median_income",
-        y="rent_burden_pct",
-        color="borough",
-        size="project_count",
-        size_max=28,
-        hover_data=["zip_code", "severe_burden_pct", "project_count"],
-        color_discrete_sequence=PALETTE,
-        template="plotly_white",
-        labels={
-            "median_income":   "Median Household Income ($)",
-            "rent_burden_pct": "Rent Burden (%)",
-            "borough":         "Borough",
-        },
-    )
-    # Reference line at 30% burden
-    fig5.add_hline(
-        y=30,
-        line_dash="dot",
-        line_color="#AAA",
-        annotation_text="30% burden threshold",
-        annotation_position="right",
-    )
-    fig5.update_layout(
-        height=420,
-        margin=dict(t=10, b=0, l=0, r=0),
-        font_family="Inter",
-        plot_bgcolor="#F9F7F4",
-        paper_bgcolor="#F9F7F4",
+    st.plotly_chart(
+        _fig_scatter(df_scatter),
+        use_container_width=True,
+        key="fig_scatter",
+        config=_PLOTLY_CONFIG,
     )
-    st.plotly_chart(fig5, use_container_width=True)
 
 st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
 # ── Section 5: Rent burden distribution histogram ──────────────────────
 st.markdown("#### Distribution of ZIP-Level Rent Burden")
 
-df_hist = _q("""
-    MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
-    WHERE a.rent_burden_rate IS NOT NULL
-    RETURN z.borough           AS borough,
-           a.rent_burden_rate * 100 AS rent_burden_pct
-""")
+df_hist = _sections().get("hist", pd.DataFrame())
 
 if not df_hist.empty:
-    fig6 = px.histogram(
-        df_hist,
-        x="rent_burden_pct",
-        color="borough",
-        nbins=20,
-        opacity=0.75,
-        barmode="overlay",
-        color_discrete_sequence=PALETTE,
-        template="plotly_white",
-        labels={"rent_burden_pct": "Rent Burden (%)", "count": "ZIP Codes"},
-    )
-    fig6.add_vline(
-        x=30,
-        line_dash="dot",
-        line_color="#444",
-        annotation_text="30%",
-    )
-    fig6.update_layout(
-        height=300,
-        margin=dict(t=10, b=0, l=0, r=0),
-        font_family="Inter",
-        legend_title="Borough",
-        plot_bgcolor="#F9F7F4",
-        paper_bgcolor="#F9F7F4",
+    st.plotly_chart(
+        _fig_histogram(df_hist),
+        use_container_width=True,
+        key="fig_hist",
+        config=_PLOTLY_CONFIG,
     )
-    st.plotly_chart(fig6, use_container_width=True)
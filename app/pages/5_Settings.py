@@ -8,10 +8,12 @@ from pathlib import Path
 
 import streamlit as st
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_APP_DIR = str(Path(__file__).parent.parent)
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
 from utils.theme import inject_theme
-from utils.connection import get_config, get_db_stats
+from utils.connection import get_config, get_db_stats, get_translator
 
 st.set_page_config(
     page_title="Settings — NYC Housing Graph",
@@ -20,6 +22,24 @@ st.set_page_config(
 )
 inject_theme()
 
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _verify_key(key_hash: str) -> bool:
+    """Verify a key against the provider, cached per key-hash for an hour.
+
+    Keyed on a SHA-256 of the key so the raw secret never enters the
+    cache key map (same pattern as the translator cache); the actual key
+    is read from session state at call time. Raises on auth failure so
+    failures are never cached.
+    """
+    import anthropic
+
+    key = st.session_state.get("_verify_candidate", "")
+    # models.list is a cheap metadata GET — validates auth without a
+    # billable model invocation
+    anthropic.Anthropic(api_key=key).models.list(limit=1)
+    return True
+
 with st.sidebar:
     st.markdown(
         '<span class="sidebar-brand">NYC Housing <span>Graph</span></span>',
@@ -50,30 +70,60 @@ with cfg_col:
     if "api_key" not in st.session_state:
         st.session_state["api_key"] = os.environ.get("ANTHROPIC_API_KEY", "")
 
-    api_input = st.text_input(
+    def _store_key() -> None:
+        # Widget-backed keys are deleted whenever their page isn't
+        # rendered, so the Ask page must read the key from a plain
+        # session key that survives navigation
+        st.session_state["api_key"] = st.session_state["_api_key_input"]
+
+    # The widget owns a private key and pushes changes into the durable
+    # one via on_change — still no per-rerun compare-and-assign. Re-seed
+    # the widget key on each visit in case Streamlit pruned it.
+    if "_api_key_input" not in st.session_state:
+        st.session_state["_api_key_input"] = st.session_state["api_key"]
+    st.text_input(
         "api_key",
-        value=st.session_state.get("api_key", ""),
+        key="_api_key_input",
+        on_change=_store_key,
         type="password",
         placeholder="sk-ant-...",
         label_visibility="collapsed",
     )
-
-    save_col, clear_col, _ = st.columns([1, 1, 3])
-    with save_col:
-        if st.button("Save", type="primary", use_container_width=True):
-            if api_input.strip():
-                st.session_state["api_key"] = api_input.strip()
-                st.markdown(
-                    '<div class="success-msg">Key saved for this session.</div>',
-                    unsafe_allow_html=True,
-                )
+    st.caption("Saved automatically for this session.")
+
+    def _clear_key() -> None:
+        # Callbacks run before widget instantiation, so writing a
+        # widget-backed key here is legal
+        st.session_state["api_key"] = ""
+        st.session_state["_api_key_input"] = ""
+
+    verify_col, clear_col, _ = st.columns([1, 1, 3])
+    with verify_col:
+        if st.button("Verify", use_container_width=True):
+            key = st.session_state.get("api_key", "").strip()
+            if not key:
+                st.warning("Enter a key to verify.")
             else:
-                st.warning("Enter a valid key.")
+                with st.spinner("Verifying…"):
+                    try:
+                        import hashlib
+
+                        st.session_state["_verify_candidate"] = key
+                        _verify_key(hashlib.sha256(key.encode()).hexdigest())
+                        st.markdown(
+                            '<div class="success-msg">Key verified.</div>',
+                            unsafe_allow_html=True,
+                        )
+                    except Exception as exc:
+                        st.error(f"Verification failed: {exc}")
     with clear_col:
-        if st.button("Clear", use_container_width=True):
-            st.session_state.pop("api_key", None)
+        if st.button("Clear", on_click=_clear_key, use_container_width=True):
             st.info("Key cleared.")
 
+    if st.button("Reset AI session"):
+        get_translator.clear()
+        st.toast("Translator cache cleared — next question rebuilds it.")
+
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
     st.markdown("#### Neo4j Connection")
@@ -127,7 +177,7 @@ with status_col:
                     m2.metric("ZIP Codes",        f"{stats.get('n_ZipCode', 0):,}")
                     m3, m4 = st.columns(2)
                     m3.metric("Census Tracts",    f"{stats.get('n_RentBurden', 0):,}")
-                    m4.metric("Connections",      f"{sum(stats.get(f'r_{r}', 0) for r in ['LOCATED_IN_ZIP','NEIGHBORS','IN_CENSUS_TRACT','CONTAINS_TRACT','HAS_AFFORDABILITY_DATA']):,}")
+                    m4.metric("Connections",      f"{stats.get('total_rels', 0):,}")
                 else:
                     st.warning("Connected but no data found.")
             except Exception as exc:
@@ -10,25 +10,92 @@ import streamlit as st
 
 # Resolve project root so imports work regardless of cwd
 ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(ROOT / "src"))
+_SRC = str(ROOT / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from noah_converter.utils.config import load_config
 from noah_converter.utils.db_connection import Neo4jConnection
 
 
+# Property indexes backing the Template queries: index seeks (equality
+# on borough, range on the burden-rate thresholds) instead of full
+# label scans + filter. IF NOT EXISTS makes them a no-op after the
+# first session.
+_INDEX_STATEMENTS = (
+    "CREATE INDEX zip_borough IF NOT EXISTS FOR (z:ZipCode) ON (z.borough)",
+    "CREATE INDEX hp_borough IF NOT EXISTS FOR (p:HousingProject) ON (p.borough)",
+    "CREATE INDEX rb_severe IF NOT EXISTS"
+    " FOR (r:RentBurden) ON (r.severe_burden_rate)",
+    "CREATE INDEX aa_burden IF NOT EXISTS"
+    " FOR (a:AffordabilityAnalysis) ON (a.rent_burden_rate)",
+)
+
+
 @st.cache_resource(show_spinner=False)
 def _get_driver():
     """Create and cache the Neo4j driver for the whole app session."""
     config = load_config()
     conn = Neo4jConnection(config.target_db)
+    try:
+        with conn.driver.session(database=config.target_db.database) as session:
+            for stmt in _INDEX_STATEMENTS:
+                session.run(stmt)
+    except Exception:
+        # Read-only credentials or older server — queries still work,
+        # just without the index seek
+        pass
     return conn.driver, config
 
 
 def get_config():
+    """Return the app config parsed once per session.
+
+    Piggybacks on the st.cache_resource driver factory — repeated calls
+    are a cache lookup, not a YAML/env re-parse.
+    """
     _, config = _get_driver()
     return config
 
 
+@st.cache_resource(show_spinner=False)
+def _build_translator(api_key_hash: str, model: str):
+    """Construct the translator once per (key-hash, model) for the whole app.
+
+    Keyed on a SHA-256 of the API key so the raw secret never sits in the
+    cache key map. The actual key is resolved from session state / env at
+    build time. Clear with Settings → Reset AI session.
+    """
+    import os
+
+    from noah_converter.text2cypher import STATIC_SCHEMA_CONTEXT, Text2CypherTranslator
+
+    api_key = st.session_state.get("api_key") or os.environ.get("ANTHROPIC_API_KEY")
+    config = get_config()
+    return Text2CypherTranslator(
+        neo4j_conn=Neo4jConnection(config.target_db),
+        llm_provider="claude",
+        api_key=api_key,
+        model=model,
+        # Precomputed constant: skips ~12 introspection queries at init and
+        # keeps the prompt prefix byte-stable for provider prompt caching
+        schema_context=STATIC_SCHEMA_CONTEXT,
+    )
+
+
+def get_translator(api_key: str, model: str):
+    """Return the shared Text2Cypher translator for this API key and model."""
+    import hashlib
+
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    return _build_translator(key_hash, model)
+
+
+# Kept callable from Settings: clearing the underlying cache drops the
+# translator regardless of which key built it.
+get_translator.clear = _build_translator.clear
+
+
 def run_query(cypher: str, params: dict = None) -> list[dict]:
     """Execute a Cypher query and return a list of dicts."""
     driver, _ = _get_driver()
@@ -37,20 +104,49 @@ def run_query(cypher: str, params: dict = None) -> list[dict]:
         return [dict(r) for r in result]
 
 
+# O(1) metadata read from the count store — no graph scan at all
+_APOC_STATS_CYPHER = """
+CALL apoc.meta.stats() YIELD labels, relTypesCount
+RETURN labels, relTypesCount
+"""
+
+# Fallback: node and relationship counts in one statement → one network
+# round-trip (full scan, but only runs when APOC is unavailable)
+_STATS_CYPHER = """
+MATCH (n)
+RETURN 'n' AS kind, labels(n)[0] AS name, count(n) AS cnt
+UNION ALL
+MATCH ()-[r]->()
+RETURN 'r' AS kind, type(r) AS name, count(r) AS cnt
+"""
+
+
 @st.cache_data(ttl=300, show_spinner=False)
 def get_db_stats() -> dict:
-    """Fetch and cache live graph statistics (5-minute TTL)."""
+    """Fetch and cache live graph statistics (5-minute TTL).
+
+    Tries apoc.meta.stats() first — constant-time count-store lookups —
+    and falls back to a single whole-graph scan if APOC is not
+    installed.
+    """
     try:
         stats: dict = {}
-        for row in run_query(
-            "MATCH (n) RETURN labels(n)[0] AS lbl, count(n) AS cnt"
-        ):
-            if row["lbl"]:
-                stats[f"n_{row['lbl']}"] = row["cnt"]
-        for row in run_query(
-            "MATCH ()-[r]->() RETURN type(r) AS t, count(r) AS cnt"
-        ):
-            stats[f"r_{row['t']}"] = row["cnt"]
+        total_rels = 0
+        try:
+            row = run_query(_APOC_STATS_CYPHER)[0]
+            for label, cnt in row["labels"].items():
+                stats[f"n_{label}"] = cnt
+            for rel_type, cnt in row["relTypesCount"].items():
+                stats[f"r_{rel_type}"] = cnt
+                total_rels += cnt
+        except Exception:
+            for r in run_query(_STATS_CYPHER):
+                if not r["name"]:
+                    continue
+                stats[f"{r['kind']}_{r['name']}"] = r["cnt"]
+                if r["kind"] == "r":
+                    total_rels += r["cnt"]
+        stats["total_rels"] = total_rels
         return stats
     except Exception:
         return {}
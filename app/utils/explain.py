@@ -3,6 +3,7 @@ Parse a Cypher query's MATCH patterns and render a Graphviz path diagram.
 """
 
 import re
+from functools import lru_cache
 
 # Node label → fill colour (hex)
 _NODE_COLORS = {
@@ -13,46 +14,59 @@ _NODE_COLORS = {
 }
 _DEFAULT_COLOR = "#888888"
 
+# Compiled once at import — the diagram is re-rendered on every rerun
+# of the Explain panel, so per-call re.compile would dominate parsing
+_WS_RE = re.compile(r"\s+")
 
+# MATCH / OPTIONAL MATCH clause bodies, stopping at the next clause
+_CLAUSE_RE = re.compile(
+    r"(?:OPTIONAL\s+)?MATCH\s+(.*?)(?=\s+(?:OPTIONAL\s+)?MATCH|\s+WHERE|\s+RETURN|\s+WITH|\s+ORDER|\s+LIMIT|$)",
+    re.IGNORECASE,
+)
+
+# Node token:  (\w*(?::\w+)?(?:\s*\{[^}]*\})?)
+# Captures the *first* label after ':', ignoring alias and props
+_NODE_TOK = r"\(\s*\w*(?::(\w+))?(?:\s*\{[^}]*\})?\s*\)"
+_REL_TOK  = r"-\[:(\w+)\](-?>|-)"
+
+# Single pattern capturing from/rel/dir/to. The trailing node sits in a
+# lookahead so a chained pattern's middle nodes serve as both "to" and
+# the next segment's "from" — one finditer pass walks the whole chain
+# with no manual position bookkeeping.
+_SEG_RE = re.compile(_NODE_TOK + r"\s*" + _REL_TOK + r"(?=\s*" + _NODE_TOK + r")")
+
+# DOT line templates, pre-bound so the emit loops do one %-substitution
+# per line instead of parsing an f-string format spec each iteration
+_NODE_TMPL = '  "%s" [label=":%s", fillcolor="%s", fontcolor="%s"];'
+_EDGE_TMPL = '  "%s" -> "%s" [label="%s", arrowhead=%s];'
+
+
+@lru_cache(maxsize=256)
 def cypher_to_dot(cypher: str) -> str | None:
     """
     Extract MATCH/OPTIONAL MATCH patterns from *cypher* and return a
     Graphviz DOT string, or None if no node–rel–node patterns are found.
 
+    Pure function of the query text, so results are memoized — Streamlit
+    re-renders the Explain panel with the same Cypher on every rerun,
+    and repeat calls skip the parse and DOT assembly entirely.
+
     Handles:
       (alias:Label {props})-[:REL]->(alias:Label)   directed
       (alias:Label)-[:REL]-(alias:Label)             undirected
       chained: (a:A)-[:R1]->(b:B)-[:R2]->(c:C)
     """
     # Normalise whitespace
-    text = re.sub(r"\s+", " ", cypher)
+    text = _WS_RE.sub(" ", cypher)
 
     # ── Extract all MATCH / OPTIONAL MATCH clause bodies ─────────────
-    # Stop at WHERE / RETURN / WITH / ORDER / LIMIT
-    clause_re = re.compile(
-        r"(?:OPTIONAL\s+)?MATCH\s+(.*?)(?=\s+(?:OPTIONAL\s+)?MATCH|\s+WHERE|\s+RETURN|\s+WITH|\s+ORDER|\s+LIMIT|$)",
-        re.IGNORECASE,
-    )
-    clauses = [m.group(1) for m in clause_re.finditer(text)]
-
-    # ── Pattern: node-rel-node ────────────────────────────────────────
-    # Node token:  (\w*(?::\w+)?(?:\s*\{[^}]*\})?)
-    # Captures the *first* label after ':', ignoring alias and props
-    node_tok = r"\(\s*\w*(?::(\w+))?(?:\s*\{[^}]*\})?\s*\)"
-    rel_tok  = r"-\[:(\w+)\](-?>|-)"
-
-    # Build a single pattern that captures from/rel/dir/to
-    seg_re = re.compile(node_tok + r"\s*" + rel_tok + r"\s*" + node_tok)
+    clauses = [m.group(1) for m in _CLAUSE_RE.finditer(text)]
 
     edges: list[tuple[str, str, str, bool]] = []   # (from, rel, to, directed)
     seen_nodes: set[str] = set()
 
     for clause in clauses:
-        pos = 0
-        while True:
-            m = seg_re.search(clause, pos)
-            if not m:
-                break
+        for m in _SEG_RE.finditer(clause):
             from_label = m.group(1) or "?"
             rel_type   = m.group(2)
             arrow      = m.group(3)      # "->" or "-"
@@ -64,11 +78,6 @@ def cypher_to_dot(cypher: str) -> str | None:
                 seen_nodes.add(from_label)
                 seen_nodes.add(to_label)
 
-            # Advance past the *to* node so chained patterns are captured
-            pos = m.end() - len(m.group(0).split(")")[-1]) - 1
-            if pos <= m.start():
-                pos = m.end()
-
     if not edges:
         return None
 
@@ -82,11 +91,8 @@ def cypher_to_dot(cypher: str) -> str | None:
     ]
 
     for label in seen_nodes:
-        color    = _NODE_COLORS.get(label, _DEFAULT_COLOR)
-        fc       = "white"
-        lines.append(
-            f'  "{label}" [label=":{label}", fillcolor="{color}", fontcolor="{fc}"];'
-        )
+        color = _NODE_COLORS.get(label, _DEFAULT_COLOR)
+        lines.append(_NODE_TMPL % (label, label, color, "white"))
 
     seen_edges: set[tuple] = set()
     for from_l, rel, to_l, directed in edges:
@@ -95,9 +101,7 @@ def cypher_to_dot(cypher: str) -> str | None:
             continue
         seen_edges.add(key)
         arrow = "normal" if directed else "none"
-        lines.append(
-            f'  "{from_l}" -> "{to_l}" [label="{rel}", arrowhead={arrow}];'
-        )
+        lines.append(_EDGE_TMPL % (from_l, to_l, rel, arrow))
 
     lines.append("}")
     return "\n".join(lines)
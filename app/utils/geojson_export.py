@@ -6,63 +6,87 @@ FeatureCollection string suitable for use in mapping tools.
 """
 
 import json
-from typing import Optional
+import math
+import re
+from typing import Iterator, Optional
 
+import numpy as np
 
-def _find_col(keys: list[str], candidates: list[str]) -> Optional[str]:
-    """Find the first key that matches any candidate substring (case-insensitive)."""
-    for k in keys:
-        k_lower = k.lower()
-        if any(c in k_lower for c in candidates):
-            return k
-    return None
+# orjson serializes dict-heavy numeric payloads several times faster
+# than stdlib json; it is optional, so fall back when not installed
+try:
+    import orjson
 
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
 
-def rows_to_geojson(
+
+def _coerce(value) -> float:
+    """float() that maps unparseable/missing values to NaN."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+# Coordinate-column name patterns, compiled once: one alternation scan
+# per key instead of a lower() allocation plus a substring loop
+_LAT_RE = re.compile(r"center_lat|latitude|_lat|\.lat", re.IGNORECASE)
+_LON_RE = re.compile(r"center_lon|center_lng|longitude|_lon|_lng|\.lon", re.IGNORECASE)
+
+
+def _find_col(keys: list[str], pattern: re.Pattern) -> Optional[str]:
+    """Find the first key the (case-insensitive) pattern matches."""
+    return next((k for k in keys if pattern.search(k)), None)
+
+
+def iter_geojson(
     rows: list[dict],
     lat_col: Optional[str] = None,
     lon_col: Optional[str] = None,
     props_cols: Optional[list[str]] = None,
-) -> Optional[str]:
+) -> Iterator[str]:
     """
-    Convert a list of result dicts to a GeoJSON FeatureCollection string.
-
-    Auto-detects latitude/longitude columns by name if lat_col/lon_col not given.
-    Accepts exact column names OR columns containing 'lat'/'lon' as substrings
-    (e.g. 'center_lat', 'z.center_lat', 'latitude').
-
-    Args:
-        rows: List of dicts from run_query()
-        lat_col: Column name containing latitude values (auto-detected if None)
-        lon_col: Column name containing longitude values (auto-detected if None)
-        props_cols: Columns to include as GeoJSON properties (None = all other cols)
+    Yield a GeoJSON FeatureCollection as string chunks, one Feature at a
+    time — peak memory holds one encoded Feature instead of the whole
+    feature list plus its full json.dumps output.
 
-    Returns:
-        GeoJSON FeatureCollection as a JSON string, or None if no valid rows found.
+    Yields nothing at all (an empty iterator) when no coordinate columns
+    or no valid rows are found. See rows_to_geojson for the column
+    auto-detection rules.
     """
     if not rows:
-        return None
+        return
 
     keys = list(rows[0].keys())
 
     # Auto-detect lat/lon columns
     if lat_col is None:
-        lat_col = _find_col(keys, ["center_lat", "latitude", "_lat", ".lat"])
+        lat_col = _find_col(keys, _LAT_RE)
     if lon_col is None:
-        lon_col = _find_col(keys, ["center_lon", "center_lng", "longitude", "_lon", "_lng", ".lon"])
+        lon_col = _find_col(keys, _LON_RE)
 
     if lat_col is None or lon_col is None:
-        return None  # No coordinate columns found
-
-    features = []
-    for row in rows:
-        lat = row.get(lat_col)
-        lon = row.get(lon_col)
-        try:
-            lat = float(lat)
-            lon = float(lon)
-        except (TypeError, ValueError):
-            continue  # Skip rows without valid coordinates
+        return  # No coordinate columns found
+
+    # Parse both coordinate columns in one shot and mask invalid rows
+    # with isfinite in C, instead of a per-row float()/try/except walk.
+    # Also drops NaN/inf coordinates, which are not valid GeoJSON.
+    n = len(rows)
+    lats = np.fromiter((_coerce(r.get(lat_col)) for r in rows), dtype=np.float64, count=n)
+    lons = np.fromiter((_coerce(r.get(lon_col)) for r in rows), dtype=np.float64, count=n)
+    valid = np.flatnonzero(np.isfinite(lats) & np.isfinite(lons))
+
+    if valid.size == 0:
+        return
+
+    yield '{"type": "FeatureCollection", "features": ['
+    first = True
+    for i in valid:
+        row = rows[i]
 
         # Determine property columns
         if props_cols is not None:
@@ -70,20 +94,43 @@ def rows_to_geojson(
         else:
             props = {k: v for k, v in row.items() if k not in (lat_col, lon_col)}
 
-        features.append({
+        feature = {
             "type": "Feature",
             "geometry": {
                 "type": "Point",
-                "coordinates": [lon, lat],  # GeoJSON is [longitude, latitude]
+                # GeoJSON is [longitude, latitude]; np.float64 is a
+                # float subclass, so json.dumps handles it directly
+                "coordinates": [lons[i], lats[i]],
             },
             "properties": props,
-        })
+        }
+        chunk = _dumps(feature)
+        yield chunk if first else ", " + chunk
+        first = False
+
+    yield "]}"
+
+
+def rows_to_geojson(
+    rows: list[dict],
+    lat_col: Optional[str] = None,
+    lon_col: Optional[str] = None,
+    props_cols: Optional[list[str]] = None,
+) -> Optional[str]:
+    """
+    Convert a list of result dicts to a GeoJSON FeatureCollection string.
 
-    if not features:
-        return None
+    Auto-detects latitude/longitude columns by name if lat_col/lon_col not given.
+    Accepts exact column names OR columns containing 'lat'/'lon' as substrings
+    (e.g. 'center_lat', 'z.center_lat', 'latitude').
+
+    Args:
+        rows: List of dicts from run_query()
+        lat_col: Column name containing latitude values (auto-detected if None)
+        lon_col: Column name containing longitude values (auto-detected if None)
+        props_cols: Columns to include as GeoJSON properties (None = all other cols)
 
-    collection = {
-        "type": "FeatureCollection",
-        "features": features,
-    }
-    return json.dumps(collection, ensure_ascii=False)
+    Returns:
+        GeoJSON FeatureCollection as a JSON string, or None if no valid rows found.
+    """
+    return "".join(iter_geojson(rows, lat_col, lon_col, props_cols)) or None
@@ -3,28 +3,63 @@ Persistent saved-query store backed by a local JSON file.
 """
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 
+# Optional fast path: orjson parses/serializes the store several times
+# faster than stdlib json; behavior is identical either way
+try:
+    import orjson
+
+    def _loads(text: str) -> list[dict]:
+        return orjson.loads(text)
+
+    def _dumps(queries: list[dict]) -> str:
+        return orjson.dumps(queries, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _loads(text: str) -> list[dict]:
+        return json.loads(text)
+
+    def _dumps(queries: list[dict]) -> str:
+        return json.dumps(queries, indent=2)
+
 _STORE = Path(__file__).parent.parent / "saved_queries.json"
 
+# Parsed store cached in-process, keyed on the file's mtime: the
+# back-to-back _load calls a Streamlit rerun triggers cost one stat()
+# each instead of a disk read + JSON parse. External edits to the file
+# bump the mtime and invalidate naturally.
+_CACHE: tuple[int, list[dict]] | None = None
+
 
 def _load() -> list[dict]:
-    if not _STORE.exists():
-        return []
+    global _CACHE
+    mtime = _STORE.stat().st_mtime_ns if _STORE.exists() else 0
+    if _CACHE is not None and _CACHE[0] == mtime:
+        return _CACHE[1]
     try:
-        return json.loads(_STORE.read_text())
+        queries = _loads(_STORE.read_text()) if mtime else []
     except Exception:
-        return []
+        queries = []
+    _CACHE = (mtime, queries)
+    return queries
 
 
 def _save(queries: list[dict]) -> None:
-    _STORE.write_text(json.dumps(queries, indent=2))
+    global _CACHE
+    # Write-to-temp + rename: a crash mid-write leaves the old store
+    # intact instead of a truncated file
+    tmp = _STORE.with_suffix(".json.tmp")
+    tmp.write_text(_dumps(queries))
+    os.replace(tmp, _STORE)
+    _CACHE = (_STORE.stat().st_mtime_ns, queries)
 
 
 def list_saved() -> list[dict]:
     """Return all saved queries, newest first."""
-    return list(reversed(_load()))
+    # Negative-step slice: one C-level reversed copy, no iterator object
+    return _load()[::-1]
 
 
 def save_query(name: str, cypher: str) -> None:
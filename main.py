@@ -14,11 +14,10 @@ from rich.table import Table as RichTable
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from noah_converter.utils.config import load_config
-from noah_converter.utils.logger import setup_logger
-from noah_converter.utils.db_connection import PostgreSQLConnection, Neo4jConnection
-from noah_converter.schema_analyzer import SchemaAnalyzer
-from noah_converter.mapping_engine import MappingEngine, CypherDDLGenerator, SpatialConfig
+# noah_converter imports are deferred into the commands that need them:
+# each drags in heavy dependencies (psycopg2, neo4j driver, yaml, ...),
+# so `python main.py --help` and single-command runs only pay for what
+# they actually use.
 
 console = Console()
 
@@ -29,6 +28,9 @@ console = Console()
 @click.pass_context
 def cli(ctx, config, verbose):
     """NOAH PostgreSQL to Neo4j Converter CLI"""
+    from noah_converter.utils.config import load_config
+    from noah_converter.utils.logger import setup_logger
+
     ctx.ensure_object(dict)
 
     # Load configuration
@@ -50,6 +52,9 @@ def cli(ctx, config, verbose):
 @click.pass_context
 def analyze(ctx, schema, export):
     """Analyze PostgreSQL database schema"""
+    from noah_converter.schema_analyzer import SchemaAnalyzer
+    from noah_converter.utils.db_connection import PostgreSQLConnection
+
     config = ctx.obj["config"]
 
     console.print("[bold blue]Starting schema analysis...[/bold blue]")
@@ -81,6 +86,10 @@ def analyze(ctx, schema, export):
 @click.pass_context
 def generate_mapping(ctx, schema, config_file, output_dir):
     """Generate RDBMS to graph mapping"""
+    from noah_converter.mapping_engine import MappingEngine, CypherDDLGenerator, SpatialConfig
+    from noah_converter.schema_analyzer import SchemaAnalyzer
+    from noah_converter.utils.db_connection import PostgreSQLConnection
+
     config = ctx.obj["config"]
 
     console.print("[bold blue]🗺️  Generating Graph Mapping...[/bold blue]\n")
@@ -180,7 +189,9 @@ def interpret(ctx, schema, hints, output, save_raw):
     import os
     from rich.panel import Panel
     from rich.text import Text
+    from noah_converter.schema_analyzer import SchemaAnalyzer
     from noah_converter.schema_interpreter import SchemaInterpreter
+    from noah_converter.utils.db_connection import PostgreSQLConnection
 
     config = ctx.obj["config"]
 
@@ -375,6 +386,7 @@ def query(ctx, question, provider, model, no_execute, no_explain):
     """Query the graph using natural language (Text2Cypher)"""
     import os
     from noah_converter.text2cypher import Text2CypherTranslator
+    from noah_converter.utils.db_connection import Neo4jConnection
 
     config = ctx.obj["config"]
 
@@ -673,6 +685,8 @@ def validate(ctx):
 @click.pass_context
 def status(ctx):
     """Show connection status and database info"""
+    from noah_converter.utils.db_connection import PostgreSQLConnection, Neo4jConnection
+
     config = ctx.obj["config"]
 
     console.print("[bold blue]Database Connection Status[/bold blue]\n")
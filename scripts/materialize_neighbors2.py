@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Materialize 2-hop ZIP adjacency as NEIGHBORS_2 relationships.
+
+Template 2's "2 hops" mode expands [:NEIGHBORS*1..2] at query time —
+every neighbor's neighbors are walked and DISTINCT-ed per run. ZIP
+adjacency only changes when the shapes are re-migrated, so the
+deduplicated ≤2-hop pairs can be stored once and the template becomes a
+single-hop lookup.
+
+Each pair is stored once (a.zip_code < c.zip_code); queries traverse
+undirected with -[:NEIGHBORS_2]-. Safe to re-run: MERGE is idempotent.
+
+Usage:
+    python scripts/materialize_neighbors2.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from noah_converter.utils.config import load_config
+from noah_converter.utils.db_connection import Neo4jConnection
+
+MATERIALIZE_CYPHER = """
+MATCH (a:ZipCode)-[:NEIGHBORS*1..2]-(c:ZipCode)
+WHERE a.zip_code < c.zip_code
+WITH DISTINCT a, c
+MERGE (a)-[:NEIGHBORS_2]->(c)
+RETURN count(*) AS pairs
+"""
+
+
+def main() -> None:
+    print("=" * 60)
+    print("Materializing NEIGHBORS_2 (2-hop ZIP adjacency)")
+    print("=" * 60)
+
+    config = load_config()
+    conn = Neo4jConnection(config.target_db)
+
+    with conn.driver.session(database=config.target_db.database) as session:
+        pairs = session.run(MATERIALIZE_CYPHER).single()["pairs"]
+        print(f"✅ NEIGHBORS_2 pairs materialized: {pairs}")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Refresh materialized per-borough aggregates as BoroughStats nodes.
+
+The Insights page re-runs its borough-level aggregations (project
+counts, rent-burden averages) every time its 5-minute cache expires,
+even though the underlying housing data changes roughly monthly. This
+script folds those aggregations into five BoroughStats nodes so the
+page can read them back with a trivial node fetch. Run it after each
+migration, or from a daily cron.
+
+Safe to re-run: MERGE keyed on borough, properties overwritten in place.
+
+Usage:
+    python scripts/refresh_borough_stats.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from noah_converter.utils.config import load_config
+from noah_converter.utils.db_connection import Neo4jConnection
+
+# Matches the live 'borough' section of the Insights page
+REFRESH_PROJECT_STATS = """
+MATCH (p:HousingProject)
+WITH p.borough AS borough, count(p) AS projects, sum(p.total_units) AS total_units
+MERGE (b:BoroughStats {borough: borough})
+SET b.projects     = projects,
+    b.total_units  = total_units,
+    b.refreshed_at = datetime()
+RETURN count(*) AS boroughs
+"""
+
+# Matches the live 'burden' section — values stored unrounded, exactly
+# as the page's queries would return them
+REFRESH_BURDEN_STATS = """
+MATCH (z:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(a:AffordabilityAnalysis)
+WHERE a.rent_burden_rate IS NOT NULL
+WITH z.borough                       AS borough,
+     avg(a.rent_burden_rate) * 100   AS avg_rent_burden_pct,
+     avg(a.severe_burden_rate) * 100 AS avg_severe_burden_pct,
+     avg(a.median_income_usd)        AS avg_income,
+     count(z)                        AS zip_count
+MERGE (b:BoroughStats {borough: borough})
+SET b.avg_rent_burden_pct   = avg_rent_burden_pct,
+    b.avg_severe_burden_pct = avg_severe_burden_pct,
+    b.avg_income            = avg_income,
+    b.zip_count             = zip_count,
+    b.refreshed_at          = datetime()
+RETURN count(*) AS boroughs
+"""
+
+
+def main() -> None:
+    print("=" * 60)
+    print("Refreshing BoroughStats (materialized Insights aggregates)")
+    print("=" * 60)
+
+    config = load_config()
+    conn = Neo4jConnection(config.target_db)
+
+    with conn.driver.session(database=config.target_db.database) as session:
+        n = session.run(REFRESH_PROJECT_STATS).single()["boroughs"]
+        print(f"✅ Project stats refreshed for {n} boroughs")
+        n = session.run(REFRESH_BURDEN_STATS).single()["boroughs"]
+        print(f"✅ Burden stats refreshed for {n} boroughs")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,13 @@ Text2Cypher: Natural Language to Cypher Query Translation
 
 from .translator import Text2CypherTranslator
 from .schema_context import SchemaContextBuilder
+from .static_schema import STATIC_SCHEMA_CONTEXT
 from .providers import BaseLLMProvider, LLMProviderFactory
 
 __all__ = [
     'Text2CypherTranslator',
     'SchemaContextBuilder',
+    'STATIC_SCHEMA_CONTEXT',
     'BaseLLMProvider',
     'LLMProviderFactory'
 ]
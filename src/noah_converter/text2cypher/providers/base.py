@@ -64,9 +64,19 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    # 合法的 Cypher 起始子句（用于排除 LLM 输出的解释性文字）
+    _OPENING_CLAUSES = (
+        'MATCH', 'OPTIONAL', 'CREATE', 'MERGE', 'WITH', 'CALL',
+        'UNWIND', 'RETURN', 'CYPHER', 'EXPLAIN', 'PROFILE', 'SHOW'
+    )
+
     def validate_cypher(self, cypher: str) -> bool:
         """
-        基本的 Cypher 语法验证
+        本地 Cypher 结构预检查
+
+        在发给 Neo4j 之前拦截明显畸形的输出（以自然语言开头、
+        括号不配对），省掉一次注定失败的数据库往返。不是完整
+        解析器——可疑时放行，由 Neo4j 做最终裁决。
 
         Args:
             cypher: Cypher query string
@@ -74,17 +84,51 @@ class BaseLLMProvider(ABC):
         Returns:
             True if valid, False otherwise
         """
-        # 基本检查
         cypher = cypher.strip()
 
         if not cypher:
             return False
 
+        # 起始子句检查前先跳过开头的 // 注释行（注释是合法 Cypher）
+        lines = cypher.split('\n')
+        while lines and (not lines[0].strip() or lines[0].strip().startswith('//')):
+            lines.pop(0)
+        body = '\n'.join(lines).strip()
+        if not body:
+            return False
+
+        upper = body.upper()
+
+        # 必须以合法的起始子句开头
+        if not upper.startswith(self._OPENING_CLAUSES):
+            return False
+
         # 检查是否包含 Cypher 关键字
         cypher_keywords = ['MATCH', 'RETURN', 'WHERE', 'CREATE', 'WITH', 'OPTIONAL']
-        has_keyword = any(keyword in cypher.upper() for keyword in cypher_keywords)
+        if not any(keyword in upper for keyword in cypher_keywords):
+            return False
 
-        return has_keyword
+        # 括号配对检查（跳过字符串字面量，含 \' 反斜杠转义）
+        pairs = {')': '(', ']': '[', '}': '{'}
+        stack = []
+        quote = None
+        escaped = False
+        for ch in cypher:
+            if quote:
+                if escaped:
+                    escaped = False
+                elif ch == '\\':
+                    escaped = True
+                elif ch == quote:
+                    quote = None
+            elif ch in ('"', "'"):
+                quote = ch
+            elif ch in '([{':
+                stack.append(ch)
+            elif ch in ')]}':
+                if not stack or stack.pop() != pairs[ch]:
+                    return False
+        return not stack and quote is None
 
     def clean_cypher(self, cypher: str) -> str:
         """
@@ -59,18 +59,27 @@ class ClaudeProvider(BaseLLMProvider):
         Returns:
             Cypher query string
         """
-        # 构建 prompt
-        prompt = self._build_cypher_prompt(question, schema_context, examples)
+        # 静态部分（指令 + schema + examples）放进 system block 并标记
+        # prompt caching，问题单独作为 user message —— 重复提问时
+        # schema 前缀命中缓存，大幅降低输入 token 成本和首 token 延迟
+        system_prompt = self._build_system_prompt(schema_context, examples)
 
         # 调用 Claude API
         response = self.client.messages.create(
             model=self.model,
             max_tokens=self.max_tokens,
             temperature=self.temperature,
+            system=[
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
             messages=[
                 {
                     "role": "user",
-                    "content": prompt
+                    "content": f"User Question: {question}\n\nGenerate the Cypher query:"
                 }
             ]
         )
@@ -125,13 +134,12 @@ Provide a brief, non-technical explanation of what these results mean in answer
 
         return response.content[0].text.strip()
 
-    def _build_cypher_prompt(
+    def _build_system_prompt(
         self,
-        question: str,
         schema_context: str,
         examples: Optional[str] = None
     ) -> str:
-        """构建完整的 Cypher 生成 prompt"""
+        """构建静态 system prompt（schema + 指令 + examples，不含问题）"""
 
         prompt = f"""You are an expert Neo4j Cypher query generator for a NYC housing affordability database.
 
@@ -145,16 +153,10 @@ IMPORTANT INSTRUCTIONS:
 5. Use WHERE for filtering
 6. Return ONLY the Cypher query, no explanations
 7. Do not use markdown code blocks in your response
-
 """
 
         # 添加 few-shot examples
         if examples:
-            prompt += f"\n{examples}\n\n"
-
-        # 添加用户问题
-        prompt += f"""User Question: {question}
-
-Generate the Cypher query:"""
+            prompt += f"\n{examples}\n"
 
         return prompt
@@ -141,8 +141,21 @@ class SchemaContextBuilder:
 
     def _get_example_queries(self) -> str:
         """返回示例查询（Few-shot learning for current schema）"""
+        return EXAMPLE_QUERIES
 
-        return """## Example Queries
+    def get_schema_summary(self) -> str:
+        """返回简短的 schema 摘要"""
+        schema = self._get_schema()
+        return (
+            f"Schema: {len(schema['node_labels'])} node types "
+            f"({', '.join(schema['node_labels'])}), "
+            f"{len(schema['relationship_types'])} relationship types "
+            f"({', '.join(schema['relationship_types'])})"
+        )
+
+
+# Few-shot 示例是静态文本，放在模块级别供 static_schema 复用
+EXAMPLE_QUERIES = """## Example Queries
 
 ### Example 1: Neighbors of a ZIP code
 Question: "Which ZIP codes neighbor 10001?"
@@ -223,13 +236,3 @@ RETURN z.zip_code, z.borough, a.rent_burden_rate, a.severe_burden_rate, a.median
 ORDER BY a.rent_burden_rate ASC
 LIMIT 10
 ```"""
-
-    def get_schema_summary(self) -> str:
-        """返回简短的 schema 摘要"""
-        schema = self._get_schema()
-        return (
-            f"Schema: {len(schema['node_labels'])} node types "
-            f"({', '.join(schema['node_labels'])}), "
-            f"{len(schema['relationship_types'])} relationship types "
-            f"({', '.join(schema['relationship_types'])})"
-        )
@@ -0,0 +1,113 @@
+"""
+Static Schema Context
+
+NOAH 图谱的 schema 是固定的（4 种节点、5 种关系），没必要在每次
+translator 初始化时跑 ~12 次 introspection 查询。这里把 schema 描述
+写成编译期常量：字节级稳定的 prompt 前缀也让 provider 端的
+prompt caching 可以命中。
+
+如果迁移规则改变了图谱结构，请同步更新本文件（或改回动态
+SchemaContextBuilder.build_context()）。
+"""
+
+from .schema_context import EXAMPLE_QUERIES
+
+_SCHEMA_TEXT = """# NYC Housing Affordability Knowledge Graph – Schema
+
+## Node Types
+
+### (:HousingProject)
+Properties:
+  - area_km2
+  - bbl
+  - bin
+  - borough
+  - building_id
+  - census_tract
+  - center_lat
+  - center_lon
+  - counted_rental_units
+  - db_id
+  - extremely_low_income_units
+  - five_br_units
+  - four_br_units
+  - house_number
+  - low_income_units
+  - middle_income_units
+  - moderate_income_units
+  - one_br_units
+  - postcode
+  - project_completion_date
+  - project_id
+  - project_name
+  - project_start_date
+  - six_br_units
+  - street_name
+  - studio_units
+  - three_br_units
+  - total_units
+  - two_br_units
+
+### (:ZipCode)
+Properties:
+  - area_km2
+  - borough
+  - center_lat
+  - center_lon
+  - zip_code
+
+### (:AffordabilityAnalysis)
+Properties:
+  - median_income_usd
+  - median_rent_usd
+  - rent_burden_rate
+  - rent_to_income_ratio
+  - severe_burden_rate
+  - zip_code
+
+### (:RentBurden)
+Properties:
+  - area_km2
+  - center_lat
+  - center_lon
+  - geo_id
+  - rent_burden_rate
+  - severe_burden_rate
+  - tract_name
+
+## Relationships
+
+### [:LOCATED_IN_ZIP]
+  Pattern: (:HousingProject)-[:LOCATED_IN_ZIP]->(:ZipCode)
+
+### [:HAS_AFFORDABILITY_DATA]
+  Pattern: (:ZipCode)-[:HAS_AFFORDABILITY_DATA]->(:AffordabilityAnalysis)
+
+### [:IN_CENSUS_TRACT]
+  Pattern: (:HousingProject)-[:IN_CENSUS_TRACT]->(:RentBurden)
+
+### [:NEIGHBORS]
+  Pattern: (:ZipCode)-[:NEIGHBORS]->(:ZipCode)
+  Properties:
+    - is_touching
+    - shared_boundary_km
+
+### [:CONTAINS_TRACT]
+  Pattern: (:ZipCode)-[:CONTAINS_TRACT]->(:RentBurden)
+  Properties:
+    - overlap_area_km2
+    - tract_coverage_ratio
+
+## Key Notes
+
+- Use snake_case for all property names (e.g., zip_code, total_units, center_lat)
+- ZipCode.zip_code is a 5-digit string (e.g., '10001')
+- HousingProject.postcode links to ZipCode.zip_code
+- HousingProject.db_id is the unique integer merge key
+- AffordabilityAnalysis rates (rent_burden_rate, severe_burden_rate, rent_to_income_ratio) are decimals (e.g., 0.35 = 35%)
+- RentBurden.geo_id is a Census tract GEOID string
+- NEIGHBORS is undirected (use -[:NEIGHBORS]- without arrow for traversal)
+- CONTAINS_TRACT has overlap_area_km2 and tract_coverage_ratio properties
+"""
+
+STATIC_SCHEMA_CONTEXT = _SCHEMA_TEXT + "\n\n" + EXAMPLE_QUERIES
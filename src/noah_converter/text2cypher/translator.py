@@ -22,6 +22,7 @@ class Text2CypherTranslator:
         llm_provider: str,
         api_key: str,
         model: Optional[str] = None,
+        schema_context: Optional[str] = None,
         **kwargs
     ):
         """
@@ -32,6 +33,8 @@ class Text2CypherTranslator:
             llm_provider: LLM provider name (claude, openai, gemini)
             api_key: API key for the LLM provider
             model: Model ID (optional, uses default if not specified)
+            schema_context: Precomputed schema context (optional — skips
+                the introspection queries at init; see static_schema)
             **kwargs: Additional provider-specific config
         """
         self.neo4j_conn = neo4j_conn
@@ -47,8 +50,11 @@ class Text2CypherTranslator:
         # 创建 schema context builder
         self.schema_builder = SchemaContextBuilder(neo4j_conn)
 
-        # 获取 schema context (缓存)
-        self.schema_context = self.schema_builder.build_context(include_examples=True)
+        # 获取 schema context：优先使用预计算常量，否则动态 introspect
+        self.schema_context = (
+            schema_context
+            or self.schema_builder.build_context(include_examples=True)
+        )
 
         logger.info(f"Text2Cypher initialized with {llm_provider} provider")
 